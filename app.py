@@ -1,54 +1,254 @@
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import HTMLResponse
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import QueryParams
 import aiohttp
 import logging
 import pandas as pd
 import numpy as np
+from numba import njit
 from datetime import datetime
 import re
 from lxml import etree
 import asyncio
-from typing import List, Dict
-import json
+import math
+from collections import defaultdict
+import bisect
+import time
+from contextlib import asynccontextmanager
+from typing import List, Dict, Optional, Tuple
+import orjson
+import gzip
+import hashlib
 import os
+from io import BytesIO, StringIO
+import sqlite3
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 app = FastAPI()
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+
+class VersionedStaticFiles(StaticFiles):
+    """StaticFiles that lets browsers keep content-hashed (?v=) assets indefinitely."""
+
+    def file_response(self, full_path, stat_result, scope, status_code=200):
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        if response.status_code in (200, 304):
+            # Unversioned requests revalidate via the ETag/Last-Modified that StaticFiles sends
+            response.headers["Cache-Control"] = (
+                "public, max-age=31536000, immutable" if "v" in QueryParams(scope["query_string"]) else "no-cache"
+            )
+        return response
+
+app.mount("/static", VersionedStaticFiles(directory=STATIC_DIR), name="static")
+
+# Assets whose URLs in index.html get a content hash; worker.js reaches app.js via a data attribute
+STATIC_ASSETS = ("app.css", "app.js", "worker.js")
+
+def asset_version(name: str) -> str:
+    with open(os.path.join(STATIC_DIR, name), "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:12]
+
+# The dashboard page never changes while the server runs, so it is versioned and compressed once up front.
+# Each asset URL carries a content hash, so browsers can cache it forever and still pick up edits.
+with open(os.path.join(STATIC_DIR, "index.html"), "rb") as f:
+    INDEX_HTML = f.read()
+for _asset in STATIC_ASSETS:
+    INDEX_HTML = INDEX_HTML.replace(
+        f'/static/{_asset}"'.encode(), f'/static/{_asset}?v={asset_version(_asset)}"'.encode()
+    )
+INDEX_HTML_GZ = gzip.compress(INDEX_HTML)
 
 BASE_URL = "https://data.sec.gov/submissions/CIK{cik}.json"
 USER_AGENT = "13F_Old (13Fnew@example.com)"
 CACHE_FILE = "fund_managers_cache.json"
+HTTP_CACHE_DB = "http_cache.sqlite"
+HOLDINGS_CACHE_DIR = "holdings_cache"
+
+# Precompiled patterns for the filing and index parsers
+_NAME_RE = re.compile(r"COMPANY CONFORMED NAME:\s*(.*?)\n")
+_TXT_HREF_RE = re.compile(r'href="/Archives/edgar/data/\d+/\d+/([^"]+\.txt)"')
+_INFO_TABLE_TYPE_RE = re.compile(rb"<TYPE>[ \t]*INFORMATION TABLE", re.IGNORECASE)
+_TEXT_RE = re.compile(r"<TEXT>(.*?)</TEXT>", re.DOTALL)
+_XML_RE = re.compile(r"<XML>(.*?)</XML>", re.DOTALL)
+_RULE_LINE_RE = re.compile(r"^[\s=_-]*[=_-]{3,}[\s=_-]*$")
+_RULE_RUN_RE = re.compile(r"[=_-]+")
+_SUFFIX_RE = re.compile(r'\b(INC|Shares|LLC|Corp|Co|Insu|Insurance|Homestate)\b', re.IGNORECASE)
+
+# The SEC header (with COMPANY CONFORMED NAME) always sits in the first few KB of a filing
+HEADER_BYTES = 8192
+
+# Below this many holdings rows, analyze_holdings skips pandas entirely
+SMALL_ANALYSIS_ROWS = 2000
+
+FORM_TYPES = {"13F-HR", "13F-HR/A", "13F-NT", "13F-NT/A", "13F-CTR", "13F-CTR/A"}
+
+# Fund managers as parallel arrays sorted by lowercase name (see build_fund_manager_index)
+FUND_MANAGER_NAMES: List[str] = []
+FUND_MANAGER_NAMES_LC: List[str] = []
+FUND_MANAGER_CIKS: List[str] = []
+# Trigram -> ascending positions in the arrays above, for substring search
+FUND_MANAGER_TRIGRAMS: Dict[str, List[int]] = {}
+
+# SEC fair-access policy: at most 10 requests per second
+SEC_MAX_CONCURRENCY = 10
+SEC_MAX_RPS = 10
+SEC_MAX_RETRIES = 4
+_SEC_SEM = asyncio.Semaphore(SEC_MAX_CONCURRENCY)
+_sec_next_slot = 0.0
+
+# Lazily opened connection to the conditional-GET cache
+_http_cache: Optional[sqlite3.Connection] = None
+
+def get_http_cache() -> sqlite3.Connection:
+    global _http_cache
+    if _http_cache is None:
+        _http_cache = sqlite3.connect(HTTP_CACHE_DB)
+        _http_cache.execute(
+            "CREATE TABLE IF NOT EXISTS http_cache "
+            "(url TEXT PRIMARY KEY, etag TEXT, last_modified TEXT, body TEXT)"
+        )
+    return _http_cache
+
+async def _sec_throttle():
+    """Wait for the next request slot so SEC traffic stays under SEC_MAX_RPS."""
+    global _sec_next_slot
+    now = time.monotonic()
+    wait = _sec_next_slot - now
+    _sec_next_slot = max(now, _sec_next_slot) + 1 / SEC_MAX_RPS
+    if wait > 0:
+        await asyncio.sleep(wait)
+
+@asynccontextmanager
+async def _sec_get(session: aiohttp.ClientSession, url: str, **kwargs):
+    """Rate-limited session.get for SEC endpoints, backing off exponentially on 429/503."""
+    async with _SEC_SEM:
+        for attempt in range(SEC_MAX_RETRIES + 1):
+            await _sec_throttle()
+            response = await session.get(url, **kwargs)
+            if response.status not in (429, 503) or attempt == SEC_MAX_RETRIES:
+                break
+            response.release()
+            delay = 2 ** attempt
+            logger.warning(f"SEC returned {response.status} for {url}, retrying in {delay}s")
+            await asyncio.sleep(delay)
+        try:
+            yield response
+        finally:
+            response.release()
+
+async def conditional_get(session: aiohttp.ClientSession, url: str, encoding: Optional[str] = None) -> Tuple[int, str]:
+    """GET url, revalidating any cached copy with If-None-Match / If-Modified-Since.
+
+    A 304 from SEC is reported as 200 with the cached body, so callers only check for 200.
+    """
+    cache = get_http_cache()
+    cached = cache.execute(
+        "SELECT etag, last_modified, body FROM http_cache WHERE url = ?", (url,)
+    ).fetchone()
+    headers = {}
+    if cached:
+        etag, last_modified, _ = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    async with _sec_get(session, url, headers=headers) as response:
+        if response.status == 304 and cached:
+            logger.info(f"Not modified, using cached copy of {url}")
+            return 200, cached[2]
+        if response.status != 200:
+            return response.status, ""
+        body = await response.text(encoding=encoding)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
 
-# Global variable for fund managers
-FUND_MANAGERS = []
+    if etag or last_modified:
+        try:
+            cache.execute(
+                "INSERT OR REPLACE INTO http_cache (url, etag, last_modified, body) VALUES (?, ?, ?, ?)",
+                (url, etag, last_modified, body),
+            )
+            cache.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Failed to cache response for {url}: {e}")
+    return 200, body
 
 # Data fetching and parsing functions
 async def fetch_filings(cik: str, session: aiohttp.ClientSession) -> List[Dict]:
     filings_url = BASE_URL.format(cik=str(cik).zfill(10))
-    headers = {"User-Agent": USER_AGENT}
-    async with session.get(filings_url, headers=headers) as response:
-        if response.status != 200:
-            logger.error(f"Failed to fetch filings for CIK {cik}: {response.status}")
-            return []
-        data = await response.json()
+    status, body = await conditional_get(session, filings_url)
+    if status != 200:
+        logger.error(f"Failed to fetch filings for CIK {cik}: {status}")
+        return []
+    data = orjson.loads(body)
     
     filings = []
     recent = data.get("filings", {}).get("recent", {})
-    for i in range(len(recent.get("accessionNumber", []))):
-        if recent["form"][i] == "13F-HR":
+    accession_numbers = recent.get("accessionNumber", [])
+    forms = recent.get("form", [])
+    filing_dates = recent.get("filingDate", [])
+    report_dates = recent.get("reportDate", [])
+    periods_of_report = recent.get("periodOfReport", [])
+    for i in range(len(accession_numbers)):
+        if forms[i] == "13F-HR":
             filing = {
-                "accession_number": recent["accessionNumber"][i],
-                "filing_date": recent["filingDate"][i],
-                "period_of_report": recent["reportDate"][i] or recent["periodOfReport"][i],
+                "accession_number": accession_numbers[i],
+                "filing_date": filing_dates[i],
+                "period_of_report": report_dates[i] or periods_of_report[i],
             }
             filings.append(filing)
+            if len(filings) == 5:  # Fetching 5 quarters
+                break
     logger.info(f"CIK {cik} - Retrieved {len(filings)} filings: {[f['period_of_report'] for f in filings]}")
-    return filings[:5]  # Fetching 5 quarters
-
-async def fetch_filing_details(cik: str, filing: Dict, session: aiohttp.ClientSession) -> List[Dict]:
+    return filings
+
+async def read_info_table(response: aiohttp.ClientResponse) -> Tuple[str, Optional[str]]:
+    """Stream a combined filing and stop as soon as its INFORMATION TABLE document is complete.
+
+    Returns the decoded SEC header block and the INFORMATION TABLE document (None if absent).
+    Bytes preceding the table are discarded as they arrive instead of being held in memory.
+    """
+    encoding = response.charset or "utf-8"
+    buf = bytearray()
+    header = None
+    start = -1
+    scanned = 0
+    async for chunk in response.content.iter_chunked(65536):
+        buf += chunk
+        if header is None and len(buf) >= HEADER_BYTES:
+            header = bytes(buf[:HEADER_BYTES])
+        if start < 0:
+            type_match = _INFO_TABLE_TYPE_RE.search(buf, scanned)
+            if type_match:
+                start = type_match.start()
+                scanned = start
+            else:
+                # Keep a small overlap in case the marker straddles two chunks
+                scanned = max(0, len(buf) - 64)
+                if header is not None:
+                    del buf[:scanned]
+                    scanned = 0
+        if start >= 0:
+            end = buf.find(b"</TEXT>", scanned)
+            if end >= 0:
+                del buf[end + len(b"</TEXT>"):]
+                break
+            scanned = max(start, len(buf) - len(b"</TEXT>"))
+
+    if header is None:
+        header = bytes(buf[:HEADER_BYTES])
+    info_table = buf[start:].decode(encoding, errors="replace") if start >= 0 else None
+    return header.decode(encoding, errors="replace"), info_table
+
+async def fetch_filing_details(cik: str, filing: Dict, session: aiohttp.ClientSession) -> Dict:
     accession_number = filing["accession_number"]
     accession_number_formatted = accession_number.replace("-", "")
     period_of_report = filing["period_of_report"]
@@ -57,191 +257,364 @@ async def fetch_filing_details(cik: str, filing: Dict, session: aiohttp.ClientSe
     base_url = f"https://www.sec.gov/Archives/edgar/data/{cik}/{accession_number_formatted}/"
     file_url = base_url + f"{accession_number}.txt"
 
-    async with session.get(file_url, headers={"User-Agent": USER_AGENT}) as response:
-        if response.status != 200:
-            logger.error(f"Failed to fetch filing details for {accession_number}: {response.status}")
-            index_url = base_url + f"{accession_number}-index.html"
-            async with session.get(index_url, headers={"User-Agent": USER_AGENT}) as index_response:
-                if index_response.status != 200:
-                    logger.error(f"Index page also unavailable for {accession_number}: {index_response.status}")
-                    return []
-                index_content = await index_response.text()
-                txt_match = re.search(r'href="/Archives/edgar/data/\d+/\d+/([^"]+\.txt)"', index_content)
-                if txt_match:
-                    file_url = f"https://www.sec.gov{txt_match.group(1)}"
-                    async with session.get(file_url, headers={"User-Agent": USER_AGENT}) as retry_response:
-                        if retry_response.status != 200:
-                            logger.error(f"Retry fetch failed for {file_url}: {retry_response.status}")
-                            return []
-                        content = await retry_response.text()
-                else:
-                    logger.error(f"No .txt file link found in index for {accession_number}")
-                    return []
-        else:
-            content = await response.text()
-
-    name_match = re.search(r"COMPANY CONFORMED NAME:\s*(.*?)\n", content)
+    # Archived filings never change, so stream them instead of going through the conditional cache
+    async with _sec_get(session, file_url) as response:
+        status = response.status
+        if status == 200:
+            header, info_table = await read_info_table(response)
+    if status != 200:
+        logger.error(f"Failed to fetch filing details for {accession_number}: {status}")
+        index_url = base_url + f"{accession_number}-index.html"
+        async with _sec_get(session, index_url) as index_response:
+            if index_response.status != 200:
+                logger.error(f"Index page also unavailable for {accession_number}: {index_response.status}")
+                return {}
+            index_content = await index_response.text()
+        txt_match = _TXT_HREF_RE.search(index_content)
+        if not txt_match:
+            logger.error(f"No .txt file link found in index for {accession_number}")
+            return {}
+        file_url = f"https://www.sec.gov{txt_match.group(1)}"
+        async with _sec_get(session, file_url) as retry_response:
+            if retry_response.status != 200:
+                logger.error(f"Retry fetch failed for {file_url}: {retry_response.status}")
+                return {}
+            header, info_table = await read_info_table(retry_response)
+
+    name_match = _NAME_RE.search(header)
     filing_manager_name = name_match.group(1) if name_match else "Unknown"
 
-    documents = content.split("<DOCUMENT>")
-    for doc in documents:
-        if not doc.strip():
-            continue
-        type_match = re.search(r"<TYPE>\s*(.*)", doc)
-        if type_match and "INFORMATION TABLE" in type_match.group(1).strip().upper():
-            text_match = re.search(r"<TEXT>(.*?)</TEXT>", doc, re.DOTALL)
-            if text_match:
-                text_content = text_match.group(1)
-                xml_match = re.search(r"<XML>(.*?)</XML>", text_content, re.DOTALL)
-                if xml_match:
-                    return parse_info_table_xml(
-                        xml_match.group(1), accession_number, cik, filing_date,
-                        period_of_report, filing_manager_name
-                    )
-                return parse_text_info_table(
-                    text_content, accession_number, cik, filing_date,
+    if info_table is not None:
+        text_match = _TEXT_RE.search(info_table)
+        if text_match:
+            text_content = text_match.group(1)
+            xml_match = _XML_RE.search(text_content)
+            if xml_match:
+                return parse_info_table_xml(
+                    xml_match.group(1), accession_number, cik, filing_date,
                     period_of_report, filing_manager_name
                 )
+            return parse_text_info_table(
+                text_content, accession_number, cik, filing_date,
+                period_of_report, filing_manager_name
+            )
     logger.error(f"No valid INFORMATION TABLE found in {accession_number}")
-    return []
+    return {}
+
+def holdings_columns(accession_number: str, cik: str, filing_date: str, period_of_report: str, filing_manager_name: str,
+                     names: List[str], cusips: List[str], values, shares) -> Dict:
+    """Columnar holdings for one filing; the scalar metadata broadcasts when passed to pd.DataFrame."""
+    return {
+        "accession_number": accession_number,
+        "cik": cik,
+        "filing_date": filing_date,
+        "period_of_report": period_of_report,
+        "filing_manager_name": filing_manager_name,
+        "name_of_issuer": names,
+        "cusip": cusips,
+        "value": np.asarray(values, dtype=np.float64),
+        "sshprnamt": np.asarray(shares, dtype=np.float64),
+    }
 
-def parse_info_table_xml(content: str, accession_number: str, cik: str, filing_date: str, period_of_report: str, filing_manager_name: str) -> List[Dict]:
-    parser = etree.XMLParser(recover=True)
+def parse_info_table_xml(content: str, accession_number: str, cik: str, filing_date: str, period_of_report: str, filing_manager_name: str) -> Dict:
     try:
-        root = etree.fromstring(content.encode(), parser=parser)
-        info_tables = root.xpath('.//*[local-name()="infoTable"]')
-        holdings = []
-        for table in info_tables:
-            holding = {
-                "accession_number": accession_number,
-                "cik": cik,
-                "filing_date": filing_date,
-                "period_of_report": period_of_report,
-                "filing_manager_name": filing_manager_name,
-                "name_of_issuer": table.xpath('.//*[local-name()="nameOfIssuer"]/text()')[0] or "",
-                "cusip": table.xpath('.//*[local-name()="cusip"]/text()')[0] or "",
-                "value": float(table.xpath('.//*[local-name()="value"]/text()')[0] or 0) * 1000,
-                "sshprnamt": float(table.xpath('.//*[local-name()="shrsOrPrnAmt"]/*[local-name()="sshPrnamt"]/text()')[0] or 0),
-            }
-            holdings.append(holding)
-        return holdings
+        names, cusips, values, shares = [], [], [], []
+        # Single streaming pass; tags are compared by local name so namespaces don't matter
+        context = etree.iterparse(BytesIO(content.strip().encode()), events=("end",), recover=True)
+        for _, elem in context:
+            if not isinstance(elem.tag, str) or elem.tag.rpartition("}")[2] != "infoTable":
+                continue
+            fields = {}
+            for child in elem.iter():
+                if isinstance(child.tag, str):
+                    fields.setdefault(child.tag.rpartition("}")[2], child.text)
+            names.append(fields.get("nameOfIssuer") or "")
+            cusips.append(fields.get("cusip") or "")
+            values.append(float(fields.get("value") or 0) * 1000)
+            shares.append(float(fields.get("sshPrnamt") or 0))
+            # Free the finished row so memory stays flat on large filings
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+        return holdings_columns(
+            accession_number, cik, filing_date, period_of_report, filing_manager_name,
+            names, cusips, values, shares,
+        )
     except Exception as e:
         logger.error(f"XML parsing error for {accession_number}: {e}")
-        return []
+        return {}
 
-def parse_text_info_table(text_content: str, accession_number: str, cik: str, filing_date: str, period_of_report: str, filing_manager_name: str) -> List[Dict]:
-    data_list = []
+def parse_text_info_table(text_content: str, accession_number: str, cik: str, filing_date: str, period_of_report: str, filing_manager_name: str) -> Dict:
     lines = text_content.splitlines()
-    headers = None
-    for i, line in enumerate(lines):
-        if "NAME OF ISSUER" in line.upper():
-            headers = re.findall(r"\b\w+\b", line)
-            start_index = i + 2
-            break
-    if not headers:
+    header_index = next((i for i, line in enumerate(lines) if "NAME OF ISSUER" in line.upper()), None)
+    if header_index is None:
         logger.error(f"No headers found in plain text table for {accession_number}")
-        return []
+        return {}
 
-    for line in lines[start_index:]:
-        if not line.strip():
-            continue
-        fields = re.findall(r"\S+", line)
-        if len(fields) >= len(headers):
-            data = dict(zip(headers, fields))
-            parsed_data = {
-                "accession_number": accession_number,
-                "cik": cik,
-                "filing_date": filing_date,
-                "period_of_report": period_of_report,
-                "filing_manager_name": filing_manager_name,
-                "name_of_issuer": data.get("NAME", ""),
-                "cusip": data.get("CUSIP", ""),
-                "value": float(data.get("VALUE", 0)) * 1000,
-                "sshprnamt": float(data.get("SHARES", 0)),
-            }
-            data_list.append(parsed_data)
-    return data_list
-
-async def get_holdings(cik: str) -> List[Dict]:
-    async with aiohttp.ClientSession() as session:
-        filings = await fetch_filings(cik, session)
-        tasks = [fetch_filing_details(cik, filing, session) for filing in filings]
-        results = await asyncio.gather(*tasks)
-        return [item for sublist in results for item in sublist]
-
-def analyze_holdings(data: List[Dict]) -> Dict:
-    df = pd.DataFrame(data)
+    # The dashed rule under the header gives each column's extent
+    rule_index = next(
+        (i for i in range(header_index + 1, min(header_index + 6, len(lines))) if _RULE_LINE_RE.match(lines[i])),
+        None,
+    )
+    if rule_index is None:
+        logger.error(f"No column rule found under plain text table headers for {accession_number}")
+        return {}
+    starts = [m.start() for m in _RULE_RUN_RE.finditer(lines[rule_index])]
+    colspecs = list(zip([0] + starts[1:], starts[1:] + [None]))
+
+    # Headers may wrap over several lines, including one or two above the NAME OF ISSUER line
+    # (EDGAR often puts "VALUE" / "SHARES/" there); join the pieces that fall in each column
+    header_start = header_index
+    while header_start > max(0, header_index - 2) and lines[header_start - 1].strip():
+        header_start -= 1
+    header_lines = lines[header_start:rule_index]
+    headers = [
+        " ".join(line[start:stop].strip() for line in header_lines).upper()
+        for start, stop in colspecs
+    ]
+
+    def find_column(*keywords):
+        return next((i for i, h in enumerate(headers) if any(k in h for k in keywords)), None)
+
+    name_col = find_column("NAME")
+    cusip_col = find_column("CUSIP")
+    value_col = find_column("VALUE")
+    shares_col = find_column("SHRS", "SHARES", "PRN AMT", "AMOUNT")
+    if name_col is None or value_col is None:
+        logger.error(f"Plain text table for {accession_number} has no issuer or value column: {headers}")
+        return {}
+
+    df = pd.read_fwf(
+        StringIO("\n".join(lines[rule_index + 1:])), colspecs=colspecs, header=None, dtype=str
+    )
     if df.empty:
-        return {"top_holdings": [], "changes": [], "all_holdings": [], "manager_name": "Unknown"}
-    
-    df["value_fixed"] = np.where(
-        (df["sshprnamt"] == 0) | ((df["value"] * 1000 / df["sshprnamt"]) > 1000),
-        df["value"] / 1000,
-        df["value"],
+        return {}
+
+    def numeric(col):
+        if col is None:
+            return pd.Series(0.0, index=df.index)
+        return pd.to_numeric(df[col].str.replace(",", "", regex=False), errors="coerce")
+
+    value = numeric(value_col)
+    # Page breaks and footers have no numeric value
+    keep = value.notna() & df[name_col].notna()
+    if cusip_col is not None:
+        # A TOTAL line carries a value but no CUSIP; counting it would double the filing's value
+        keep &= df[cusip_col].fillna("").str.strip().str.len() >= 8
+    return holdings_columns(
+        accession_number, cik, filing_date, period_of_report, filing_manager_name,
+        df.loc[keep, name_col].tolist(),
+        df.loc[keep, cusip_col].fillna("").tolist() if cusip_col is not None else [""] * int(keep.sum()),
+        value[keep].to_numpy() * 1000,
+        numeric(shares_col)[keep].fillna(0).to_numpy(),
     )
-    
-    df["period_of_report"] = pd.to_datetime(df["period_of_report"])
-    df["quarter"] = df["period_of_report"].dt.to_period("Q").astype(str)
-    
-    all_quarters = sorted(df["quarter"].unique())
+
+def holdings_cache_path(accession_number: str) -> str:
+    return os.path.join(HOLDINGS_CACHE_DIR, f"{accession_number}.parquet")
+
+async def get_holdings(cik: str, session: aiohttp.ClientSession) -> pd.DataFrame:
+    filings = await fetch_filings(cik, session)
+
+    # Filings are immutable once accepted, so parsed holdings are cached per accession number
+    frames = {}
+    for filing in filings:
+        path = holdings_cache_path(filing["accession_number"])
+        if os.path.exists(path):
+            try:
+                frames[filing["accession_number"]] = pd.read_parquet(path)
+            except Exception as e:
+                logger.error(f"Failed to read cached holdings from {path}: {e}")
+
+    misses = [filing for filing in filings if filing["accession_number"] not in frames]
+    results = await asyncio.gather(*(fetch_filing_details(cik, filing, session) for filing in misses))
+    for filing, columns in zip(misses, results):
+        frame = pd.DataFrame(columns)
+        if frame.empty:
+            continue
+        frames[filing["accession_number"]] = frame
+        try:
+            os.makedirs(HOLDINGS_CACHE_DIR, exist_ok=True)
+            frame.to_parquet(holdings_cache_path(filing["accession_number"]))
+        except Exception as e:
+            logger.error(f"Failed to cache holdings for {filing['accession_number']}: {e}")
+
+    ordered = [frames[f["accession_number"]] for f in filings if f["accession_number"] in frames]
+    if not ordered:
+        return pd.DataFrame()
+    return pd.concat(ordered, ignore_index=True)
+
+@njit(cache=True)
+def fix_values(v, s, out):
+    """Undo the x1000 scaling on filings that already reported whole dollars (implied price > $1000)."""
+    for i in range(v.size):
+        if s[i] == 0 or v[i] * 1000.0 / s[i] > 1000.0:
+            out[i] = v[i] / 1000.0
+        else:
+            out[i] = v[i]
+
+@njit(cache=True)
+def issuer_diffs(group_id, vals, shares, prev_v, prev_s, dv, ds):
+    """Fill previous-quarter values and changes for rows sorted by (issuer, quarter)."""
+    for i in range(group_id.size):
+        if i > 0 and group_id[i] == group_id[i - 1]:
+            prev_v[i] = vals[i - 1]
+            prev_s[i] = shares[i - 1]
+        else:
+            prev_v[i] = np.nan
+            prev_s[i] = np.nan
+        dv[i] = vals[i] - prev_v[i]
+        ds[i] = shares[i] - prev_s[i]
+
+def select_target_quarters(quarters) -> List[str]:
+    all_quarters = sorted(quarters)
     logger.info(f"All fetched quarters: {all_quarters}")
     
     # Ensure Q1 2024 is included if available
     target_quarters = ['2024Q1']  # Start with Q1 2024
-    recent_quarters = sorted(df["quarter"].unique(), reverse=True)
-    for q in recent_quarters:
+    for q in reversed(all_quarters):
         if q not in target_quarters and len(target_quarters) < 4:
             target_quarters.append(q)
     target_quarters = sorted(target_quarters)  # Sort for consistency
     logger.info(f"Selected quarters including Q1 2024: {target_quarters}")
+    return target_quarters
+
+def fixed_values(df: pd.DataFrame) -> np.ndarray:
+    value_fixed = np.empty(len(df))
+    fix_values(
+        df["value"].to_numpy(dtype=np.float64),
+        df["sshprnamt"].to_numpy(dtype=np.float64),
+        value_fixed,
+    )
+    return value_fixed
+
+def _analyze_small(df: pd.DataFrame) -> Dict:
+    """analyze_holdings for inputs where pandas groupby overhead dominates; aggregates with dicts instead."""
+    # period_of_report is an ISO date, so the quarter falls straight out of the month
+    quarters = [f"{p[:4]}Q{(int(p[5:7]) - 1) // 3 + 1}" for p in df["period_of_report"].tolist()]
+    target_quarters = set(select_target_quarters(set(quarters)))
+
+    values = defaultdict(float)
+    shares = defaultdict(float)
+    accessions = {}
+    manager_name = None
+    for name, quarter, value, sshprnamt, accession, manager in zip(
+        df["name_of_issuer"].tolist(), quarters, fixed_values(df).tolist(),
+        df["sshprnamt"].tolist(), df["accession_number"].tolist(), df["filing_manager_name"].tolist(),
+    ):
+        if quarter not in target_quarters:
+            continue
+        if manager_name is None:
+            manager_name = manager
+        key = (name, quarter)
+        values[key] += value
+        shares[key] += sshprnamt
+        accessions.setdefault(key, accession)
+    if not values:
+        return {"top_holdings": [], "changes": [], "all_holdings": [], "manager_name": "Unknown"}
+
+    keys = sorted(values)
+    seen_quarters = sorted({quarter for _, quarter in keys})
+    latest_quarter = seen_quarters[-1]
+    last_two_quarters = seen_quarters[-2:]
+
+    all_holdings, changes, latest = [], [], []
+    prev_name = prev_row_value = prev_row_sshprnamt = None
+    for name, quarter in keys:
+        value, sshprnamt = values[(name, quarter)], shares[(name, quarter)]
+        if name == prev_name:
+            prev_value, prev_sshprnamt = prev_row_value, prev_row_sshprnamt
+        else:
+            prev_value = prev_sshprnamt = None
+        prev_name, prev_row_value, prev_row_sshprnamt = name, value, sshprnamt
+
+        all_holdings.append({
+            "name_of_issuer": name,
+            "quarter": quarter,
+            "value_fixed": value,
+            "sshprnamt": sshprnamt,
+            "accession_number": accessions[(name, quarter)],
+            "prev_value": prev_value,
+            "value_change": value - prev_value if prev_value is not None else None,
+            "prev_sshprnamt": prev_sshprnamt,
+            "sshprnamt_change": sshprnamt - prev_sshprnamt if prev_sshprnamt is not None else None,
+            "status": "New Position" if prev_value is None and quarter in last_two_quarters else "",
+        })
+        changes.append({
+            "name_of_issuer": name,
+            "quarter": quarter,
+            "value_fixed": value,
+            "sshprnamt": sshprnamt,
+            "prev_value": prev_value,
+            "prev_sshprnamt": prev_sshprnamt,
+            "value_change": abs(value - (prev_value or 0)),
+            "sshprnamt_change": abs(sshprnamt - (prev_sshprnamt or 0)),
+        })
+        if quarter == latest_quarter:
+            latest.append({"name_of_issuer": name, "value_fixed": value, "sshprnamt": sshprnamt})
+
+    top_holdings = sorted(
+        (h for h in latest if not math.isnan(h["value_fixed"])), key=lambda h: h["value_fixed"], reverse=True
+    )[:5]
+
+    return {
+        "top_holdings": top_holdings,
+        "changes": changes,
+        "all_holdings": all_holdings,
+        "manager_name": manager_name.title(),
+    }
+
+def analyze_holdings(df: pd.DataFrame) -> Dict:
+    if df.empty:
+        return {"top_holdings": [], "changes": [], "all_holdings": [], "manager_name": "Unknown"}
+    if len(df) < SMALL_ANALYSIS_ROWS:
+        return _analyze_small(df)
+    
+    df["value_fixed"] = fixed_values(df)
+    
+    df["period_of_report"] = pd.to_datetime(df["period_of_report"])
+    df["quarter"] = df["period_of_report"].dt.to_period("Q").astype(str)
+    
+    target_quarters = select_target_quarters(df["quarter"].unique())
     df = df[df["quarter"].isin(target_quarters)]
     
     latest_quarter = df["quarter"].max()
-    earliest_quarter = df["quarter"].min()
-    top_holdings = df[df["quarter"] == latest_quarter].groupby("name_of_issuer").agg({
-        "value_fixed": "sum",
-        "sshprnamt": "sum"
-    }).nlargest(5, "value_fixed").reset_index()
-    
-    grouped = df.groupby(["name_of_issuer", "quarter"]).agg({
-        "value_fixed": "sum",
-        "sshprnamt": "sum"
-    }).reset_index()
-    grouped["prev_value"] = grouped.groupby("name_of_issuer")["value_fixed"].shift(1)
-    grouped["value_change"] = np.abs(grouped["value_fixed"] - grouped["prev_value"].fillna(0))
-    grouped["prev_sshprnamt"] = grouped.groupby("name_of_issuer")["sshprnamt"].shift(1)
-    grouped["sshprnamt_change"] = np.abs(grouped["sshprnamt"] - grouped["prev_sshprnamt"].fillna(0))
 
-    all_holdings = df.groupby(["name_of_issuer", "quarter"]).agg({
-        "value_fixed": "sum",
-        "sshprnamt": "sum",
-        "accession_number": "first"  # Include accession_number for linking to filings
-    }).reset_index()
-    all_holdings["prev_value"] = all_holdings.groupby("name_of_issuer")["value_fixed"].shift(1)
-    all_holdings["value_change"] = all_holdings["value_fixed"] - all_holdings["prev_value"]
-    all_holdings["prev_sshprnamt"] = all_holdings.groupby("name_of_issuer")["sshprnamt"].shift(1)
-    all_holdings["sshprnamt_change"] = all_holdings["sshprnamt"] - all_holdings["prev_sshprnamt"]
+    # Aggregate once per (issuer, quarter); every output below is derived from this frame
+    all_holdings = df.groupby(["name_of_issuer", "quarter"], sort=True).agg(
+        value_fixed=("value_fixed", "sum"),
+        sshprnamt=("sshprnamt", "sum"),
+        accession_number=("accession_number", "first"),  # Include accession_number for linking to filings
+    ).reset_index()
+    # Rows are sorted by (issuer, quarter), so one sweep yields every quarter-over-quarter diff
+    n = len(all_holdings)
+    prev_value, prev_sshprnamt = np.empty(n), np.empty(n)
+    value_change, sshprnamt_change = np.empty(n), np.empty(n)
+    issuer_diffs(
+        pd.factorize(all_holdings["name_of_issuer"])[0],
+        all_holdings["value_fixed"].to_numpy(dtype=np.float64),
+        all_holdings["sshprnamt"].to_numpy(dtype=np.float64),
+        prev_value, prev_sshprnamt, value_change, sshprnamt_change,
+    )
+    all_holdings["prev_value"] = prev_value
+    all_holdings["value_change"] = value_change
+    all_holdings["prev_sshprnamt"] = prev_sshprnamt
+    all_holdings["sshprnamt_change"] = sshprnamt_change
 
-    # Get the last two quarters for "New Position" status
-    unique_quarters = sorted(all_holdings["quarter"].unique())
-    last_two_quarters = unique_quarters[-2:] if len(unique_quarters) >= 2 else unique_quarters
+    top_holdings = all_holdings.loc[
+        all_holdings["quarter"].eq(latest_quarter), ["name_of_issuer", "value_fixed", "sshprnamt"]
+    ].nlargest(5, "value_fixed").reset_index(drop=True)
 
-    all_holdings["status"] = all_holdings.apply(
-        lambda row: "New Position" if (pd.isna(row["prev_value"]) and row["quarter"] in last_two_quarters) else "", 
-        axis=1
-    )
+    # "changes" reports absolute movements, treating a missing previous quarter as zero
+    grouped = all_holdings[["name_of_issuer", "quarter", "value_fixed", "sshprnamt", "prev_value", "prev_sshprnamt"]].copy()
+    grouped["value_change"] = np.abs(grouped["value_fixed"] - grouped["prev_value"].fillna(0))
+    grouped["sshprnamt_change"] = np.abs(grouped["sshprnamt"] - grouped["prev_sshprnamt"].fillna(0))
 
-    for col in ["value_fixed", "sshprnamt"]:
-        if col in top_holdings.columns:
-            top_holdings[col] = top_holdings[col].replace([np.inf, -np.inf, np.nan], None)
-    for col in ["value_fixed", "sshprnamt", "value_change", "sshprnamt_change", "prev_value", "prev_sshprnamt"]:
-        if col in all_holdings.columns:
-            all_holdings[col] = all_holdings[col].replace([np.inf, -np.inf, np.nan], None)
-    for col in ["value_fixed", "sshprnamt", "prev_value", "value_change", "prev_sshprnamt", "sshprnamt_change"]:
-        if col in grouped.columns:
-            grouped[col] = grouped[col].replace([np.inf, -np.inf, np.nan], None)
-    df = df.replace([np.inf, -np.inf, np.nan], None)
+    # Get the last two quarters for "New Position" status
+    last_two_quarters = sorted(all_holdings["quarter"].unique())[-2:]
+    is_new = all_holdings["prev_value"].isna() & all_holdings["quarter"].isin(last_two_quarters)
+    all_holdings["status"] = np.where(is_new, "New Position", "")
 
+    # NaN/inf are left in place; get_data's ORJSONResponse serializes them as null
     return {
         "top_holdings": top_holdings.to_dict(orient="records"),
         "changes": grouped.to_dict(orient="records"),
@@ -249,11 +622,31 @@ def analyze_holdings(data: List[Dict]) -> Dict:
         "manager_name": df["filing_manager_name"].iloc[0].title() if not df.empty else "Unknown"
     }
 
-async def load_fund_manager_data() -> List[Dict]:
+async def _load_idx(session: aiohttp.ClientSession, url: str) -> List[Dict]:
+    status, content = await conditional_get(session, url, encoding="utf-8")
+    if status != 200:
+        logger.error(f"Failed to fetch {url}: {status}")
+        return []
+    # company.idx is a fixed-width report, so parse all rows in one go
+    df_idx = pd.read_fwf(
+        StringIO(content),
+        skiprows=10,
+        header=None,
+        colspecs=[(0, 62), (62, 74), (74, 86), (86, 98), (98, None)],
+        names=["name", "form", "cik", "date", "file"],
+        dtype=str,
+        keep_default_na=False,
+    )
+    df_idx = df_idx[df_idx["form"].isin(FORM_TYPES)]
+    # Strip common suffixes, then title-case the cleaned name
+    names = df_idx["name"].str.replace(_SUFFIX_RE, "", regex=True).str.strip().str.title()
+    return [{"cik": cik, "name": name} for cik, name in zip(df_idx["cik"], names)]
+
+async def load_fund_manager_data(session: aiohttp.ClientSession) -> List[Dict]:
     if os.path.exists(CACHE_FILE):
         try:
-            with open(CACHE_FILE, "r", encoding="utf-8") as f:
-                cached_data = json.load(f)
+            with open(CACHE_FILE, "rb") as f:
+                cached_data = orjson.loads(f.read())
             if cached_data:
                 logger.info("Loaded fund managers from cache")
                 return cached_data
@@ -264,1111 +657,138 @@ async def load_fund_manager_data() -> List[Dict]:
         "https://www.sec.gov/Archives/edgar/full-index/2025/QTR1/company.idx",
         "https://www.sec.gov/Archives/edgar/full-index/2024/QTR4/company.idx"
     ]
-    headers = {"User-Agent": USER_AGENT}
-    data = []
 
-    async with aiohttp.ClientSession() as session:
-        for url in urls:
-            try:
-                async with session.get(url, headers=headers) as response:
-                    if response.status != 200:
-                        logger.error(f"Failed to fetch {url}: {response.status}")
-                        continue
-                    content = await response.text(encoding="utf-8")
-                    lines = content.splitlines()
-                    
-                    form_types = ["13F-HR", "13F-HR/A", "13F-NT", "13F-NT/A", "13F-CTR", "13F-CTR/A"]
-                    for line in lines[11:]:
-                        parts = re.split(r'\s+', line.strip())
-                        if len(parts) >= 5 and parts[-4] in form_types:
-                            # Clean and capitalize the name
-                            raw_name = " ".join(parts[:-4])
-                            # Expanded regex to remove common suffixes
-                            cleaned_name = re.sub(r'\b(INC|Shares|LLC|Corp|Co|Insu|Insurance|Homestate)\b', '', raw_name, flags=re.IGNORECASE).strip()
-                            # Apply title case after cleaning
-                            titled_name = cleaned_name.title()
-                            data.append({"cik": parts[-3], "name": titled_name})
-            except Exception as e:
-                logger.error(f"Error fetching or processing {url}: {e}")
-                continue
+    # Both quarters download concurrently; _sec_get keeps them within the SEC rate limit
+    results = await asyncio.gather(*(_load_idx(session, url) for url in urls), return_exceptions=True)
 
-    if not data:
+    # Remove duplicates based on the cleaned and titled name, keeping the first occurrence
+    seen = {}
+    for url, records in zip(urls, results):
+        if isinstance(records, Exception):
+            logger.error(f"Error fetching or processing {url}: {records}")
+            continue
+        for rec in records:
+            if rec["name"] not in seen:
+                seen[rec["name"]] = rec
+    if not seen:
         logger.error("No fund manager data retrieved from any URL")
         return []
-
-    # Remove duplicates based on the cleaned and titled name, keeping the first occurrence
-    df = pd.DataFrame(data).drop_duplicates(subset="name", keep="first")
-    result = df.to_dict("records")
+    result = list(seen.values())
     
     try:
-        with open(CACHE_FILE, "w", encoding="utf-8") as f:
-            json.dump(result, f)
+        with open(CACHE_FILE, "wb") as f:
+            f.write(orjson.dumps(result))
         logger.info("Cached fund managers to file")
     except Exception as e:
         logger.error(f"Failed to cache fund managers: {e}")
     
     return result
 
+def build_fund_manager_index(managers: List[Dict]):
+    global FUND_MANAGER_NAMES, FUND_MANAGER_NAMES_LC, FUND_MANAGER_CIKS, FUND_MANAGER_TRIGRAMS
+    ordered = sorted(managers, key=lambda fm: fm["name"].lower())
+    FUND_MANAGER_NAMES = [fm["name"] for fm in ordered]
+    FUND_MANAGER_NAMES_LC = [name.lower() for name in FUND_MANAGER_NAMES]
+    FUND_MANAGER_CIKS = [fm["cik"] for fm in ordered]
+    trigrams = defaultdict(list)
+    for i, name in enumerate(FUND_MANAGER_NAMES_LC):
+        for gram in {name[j:j + 3] for j in range(len(name) - 2)}:
+            trigrams[gram].append(i)
+    FUND_MANAGER_TRIGRAMS = dict(trigrams)
+
 @app.on_event("startup")
 async def startup_event():
-    global FUND_MANAGERS
-    FUND_MANAGERS = await load_fund_manager_data()
-    logger.info(f"Initialized FUND_MANAGERS with {len(FUND_MANAGERS)} entries")
-
-INDEX_HTML = """
-<!DOCTYPE html>
-<html lang="en" data-theme="light">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>SEC 13F Dashboard</title>
-    <link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/css/bootstrap.min.css" rel="stylesheet">
-    <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;600;700&display=swap" rel="stylesheet">
-    <style>
-        :root[data-theme="light"] {
-            --bg-color: #f4f7fa;
-            --text-color: #2d3748;
-            --card-bg: #ffffff;
-            --sidebar-bg: linear-gradient(180deg, #ffffff, #f8fafc);
-            --border-color: #e2e8f0;
-            --hover-bg: #edf2f7;
-            --table-header-bg: #edf2f7;
-            --new-position-bg: #e6fffa;
-            --shadow-color: rgba(0, 0, 0, 0.05);
-            --btn-primary-bg: #4a90e2;
-            --btn-primary-hover: #357abd;
-            --btn-success-bg: #38a169;
-            --btn-success-hover: #2f855a;
-            --placeholder-color: #6b7280;
-            --pagination-bg: #ffffff;
-            --pagination-active-bg: #4a90e2;
-            --pagination-active-text: #ffffff;
-            --pagination-disabled-text: #6b7280;
-            --toggle-bg: #e2e8f0;
-            --toggle-text-color: #f59e0b; /* Sun emoji color */
-            --new-position-bg: #e6fffa; /* Light teal background for pill */
-            --new-position-text: #2b6cb0; /* Darker teal text for contrast */
-            --new-position-border: #b2f5ea;
-        }
-
-        :root[data-theme="dark"] {
-            --bg-color: #1a1a1a;
-            --text-color: #e2e8f0;
-            --card-bg: #2d2d2d;
-            --sidebar-bg: linear-gradient(180deg, #2d2d2d, #262626);
-            --border-color: #404040;
-            --hover-bg: #404040;
-            --table-header-bg: #333333;
-            --new-position-bg: #1a4a3c;
-            --shadow-color: rgba(0, 0, 0, 0.2);
-            --btn-primary-bg: #2b6cb0; /* Darker blue */
-            --btn-primary-hover: #4a90e2; /* Original blue */
-            --btn-success-bg: #38a169;
-            --btn-success-hover: #48b17a;
-            --placeholder-color: #9ca3af;
-            --pagination-bg: #2d2d2d;
-            --pagination-active-bg: #4a90e2;
-            --pagination-active-text: #ffffff;
-            --pagination-disabled-text: #6b7280;
-            --toggle-bg: #404040;
-            --toggle-text-color: #60a5fa; /* Moon emoji color */
-            --new-position-bg: #2c7a7b; /* Darker teal for dark mode */
-            --new-position-text: #e6fffa; /* Light teal text for contrast */
-            --new-position-border: #4a9a9b;
-        }
-
-        body {
-            font-family: 'Inter', sans-serif;
-            background-color: var(--bg-color);
-            color: var(--text-color);
-            transition: background-color 0.3s ease, color 0.3s ease;
-        }
-
-        .sidebar {
-            height: 100vh;
-            position: fixed;
-            top: 0;
-            left: 0;
-            width: 280px;
-            padding: 30px 20px;
-            background: var(--sidebar-bg);
-            box-shadow: 2px 0 15px var(--shadow-color);
-            transition: transform 0.3s ease, background 0.3s ease;
-            z-index: 1000; /* Base z-index */
-        }
-
-
-        .sidebar-overlay {
-            display: none; /* Hidden by default */
-            position: fixed;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            background: rgba(0, 0, 0, 0.5); /* Semi-transparent black */
-            z-index: 1250; /* Below active sidebar (1300), above toggle (1200) */
-            transition: opacity 0.3s ease;
-        }
-
-        .sidebar-overlay.active {
-            display: block;
-            opacity: 1;
-        }
-
-        .sidebar.active {
-            transform: translateX(0);
-            z-index: 1300; /* Above everything when active */
-        }
-
-        .sidebar-footer {
-            padding: 20px 0;
-            text-align: center; /* Center the toggle in the footer */
-            border-top: 1px solid var(--border-color); /* Optional: Add a visual separator */
-        }
-
-        .toggle-btn {
-            display: none; /* Hidden by default on desktop */
-            position: fixed;
-            top: 15px;
-            left: 15px;
-            z-index: 1200;
-            font-size: 24px; /* Icon size */
-            padding: 8px 12px 12px 12px; /* Top: 8px, Right: 12px, Bottom: 12px, Left: 12px */
-            background-color: var(--btn-primary-bg);
-            border: none;
-            border-radius: 8px;
-            color: #ffffff;
-            transition: background-color 0.3s ease;
-        }
-
-        .toggle-btn:hover {
-            background-color: var(--btn-primary-hover); /* Use theme variable for hover */
-        }
-
-        #manager-name {
-            margin-top: 0; /* Remove any default top margin that might push it up */
-        }
-
-        .sidebar h2 {
-            font-size: 1.5rem;
-            font-weight: 700;
-            color: var(--text-color);
-            margin-bottom: 20px;
-        }
-
-        .main-content {
-            margin-left: 280px;
-            padding: 40px;
-            transition: margin-left 0.3s ease;
-        }
-
-        .card {
-            border: none;
-            border-radius: 12px;
-            box-shadow: 0 4px 20px var(--shadow-color);
-            background: var(--card-bg);
-            padding: 20px;
-            transition: transform 0.2s ease, background-color 0.3s ease;
-            color: var(--text-color);
-            position: relative; /* Helps contain children */
-        }
-
-        .card:hover {
-            transform: translateY(-5px);
-        }
-
-        /* Specific styles for chart containers */
-        .chart-container {
-            position: relative; /* Allows absolute positioning of canvas if needed */
-            height: 400px; /* Fixed height for desktop */
-            width: 100%; /* Full width of parent */
-        }
-
-        /* Style both canvases directly */
-        #top-holdings-chart, #changes-chart {
-            width: 100% !important; /* Override Chart.js inline styles */
-            height: 100% !important; /* Fill container height */
-        }
-
-        .form-control {
-            border-radius: 8px;
-            border: 1px solid var(--border-color);
-            padding: 10px;
-            background-color: var(--card-bg);
-            color: var(--text-color);
-            transition: border-color 0.2s ease, background-color 0.3s ease, color 0.3s ease;
-        }
-
-        .form-control:focus {
-            border-color: var(--btn-primary-bg);
-            box-shadow: 0 0 0 3px rgba(74, 144, 226, 0.1);
-            background-color: var(--card-bg);
-            color: var(--text-color);
-        }
-
-        .form-control::placeholder {
-            color: var(--placeholder-color);
-            opacity: 1;
-        }
-
-        .form-select {
-            border-radius: 8px;
-            border: 1px solid var(--border-color);
-            padding: 10px;
-            background-color: var(--card-bg);
-            color: var(--text-color);
-            transition: border-color 0.2s ease, background-color 0.3s ease, color 0.3s ease;
-            background-image: linear-gradient(45deg, transparent 50%, var(--text-color) 50%),
-                              linear-gradient(135deg, var(--text-color) 50%, transparent 50%);
-            background-position: calc(100% - 20px) calc(1em + 2px),
-                                 calc(100% - 15px) calc(1em + 2px);
-            background-size: 5px 5px, 5px 5px;
-            background-repeat: no-repeat;
-        }
-
-        .form-select:focus {
-            border-color: var(--btn-primary-bg);
-            box-shadow: 0 0 0 3px rgba(74, 144, 226, 0.1);
-            background-color: var(--card-bg);
-            color: var(--text-color);
-            outline: none;
-        }
-
-        .form-select option {
-            background-color: var(--card-bg);
-            color: var(--text-color);
-        }
-
-        .btn-primary {
-            background-color: var(--btn-primary-bg);
-            border: none;
-            border-radius: 8px;
-            padding: 10px 20px;
-            transition: background-color 0.2s ease;
-        }
-
-        .btn-primary:hover {
-            background-color: var(--btn-primary-hover);
-        }
-
-        .btn-success {
-            background-color: var(--btn-success-bg);
-            border: none;
-            border-radius: 8px;
-            padding: 10px 20px;
-            transition: background-color 0.2s ease;
-        }
-
-        .btn-success:hover {
-            background-color: var(--btn-success-hover);
-        }
-
-        #suggestions, #company-suggestions {
-            position: absolute;
-            z-index: 1000;
-            width: 100%;
-            max-height: 200px;
-            overflow-y: auto;
-            border-radius: 8px;
-            box-shadow: 0 4px 15px var(--shadow-color);
-            background: var(--card-bg);
-        }
-
-        .dropdown-item {
-            padding: 10px 15px;
-            color: var(--text-color);
-            transition: background-color 0.2s ease;
-        }
-
-        .dropdown-item:hover {
-            background-color: var(--hover-bg);
-        }
-
-        .table {
-            border-radius: 8px;
-            overflow: hidden;
-            color: var(--text-color);
-        }
-
-        .table th {
-            background-color: var(--table-header-bg);
-            color: var(--text-color);
-            font-weight: 600;
-        }
-
-        .table td {
-            vertical-align: middle;
-            background-color: var(--card-bg);
-            color: var(--text-color);
-        }
-
-        .new-position {
-            background-color: var(--card-bg); /* Keep row background as card-bg */
-        }
-        .status-pill {
-            display: inline-block;
-            background-color: var(--new-position-bg);
-            color: var(--new-position-text);
-            padding: 4px 12px;
-            border-radius: 16px; /* Rounded corners for pill shape */
-            font-weight: 500;
-            font-size: 0.9em;
-            border: 1px solid var(--new-position-border);
-            margin-right: 8px; /* Space between pill and link */
-        }
-
-        #loading-indicator {
-            display: none;
-            position: fixed;
-            top: 50%;
-            left: 50%;
-            transform: translate(-50%, -50%);
-            background-color: rgba(0, 0, 0, 0.8);
-            color: #ffffff;
-            padding: 15px 25px;
-            border-radius: 8px;
-            z-index: 2000;
-            font-weight: 600;
-        }
-
-        .sortable {
-            cursor: pointer;
-            user-select: none;
-            position: relative;
-        }
-
-        .sortable:hover {
-            background-color: var(--hover-bg);
-        }
-
-        .sortable::after {
-            content: "↕";
-            font-size: 0.8em;
-            margin-left: 5px;
-            opacity: 0.5;
-        }
-
-        .pagination {
-            margin-top: 20px;
-        }
-
-        .page-item .page-link {
-            background-color: var(--pagination-bg);
-            color: var(--text-color);
-            border: 1px solid var(--border-color);
-            transition: background-color 0.2s ease, color 0.2s ease;
-        }
-
-        .page-item.active .page-link {
-            background-color: var(--pagination-active-bg);
-            color: var(--pagination-active-text);
-            border-color: var(--pagination-active-bg);
-        }
-
-        .page-item:not(.active) .page-link:hover {
-            background-color: var(--hover-bg);
-            color: var(--text-color);
-        }
-
-        .page-item.disabled .page-link {
-            background-color: var(--pagination-bg);
-            color: var(--pagination-disabled-text);
-            border-color: var(--border-color);
-            pointer-events: none;
-        }
-
-        /* Moon/Sun Emoji Toggle (xAI-inspired) */
-        .theme-toggle {
-            background: var(--toggle-bg);
-            border: 1px solid var(--border-color);
-            border-radius: 50%;
-            width: 44px;
-            height: 44px;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            cursor: pointer;
-            transition: background-color 0.3s ease, transform 0.3s ease, box-shadow 0.3s ease;
-            font-size: 24px; /* Larger emoji for visibility */
-            color: var(--toggle-text-color);
-            box-shadow: 0 2px 6px var(--shadow-color);
-            margin: 0 auto; /* Center the toggle horizontally in the footer */
-        }
-
-        .theme-toggle:hover {
-            background: var(--hover-bg);
-            transform: scale(1.1);
-            box-shadow: 0 4px 12px var(--shadow-color);
-        }
-
-        .theme-toggle:active {
-            transform: scale(0.95);
-        }
-
-@media (max-width: 768px) {
-    .sidebar {
-        transform: translateX(-280px);
-    }
-    .sidebar.active {
-        transform: translateX(0);
-        z-index: 1300;
-    }
-    .sidebar-footer {
-        padding: 15px 0;
-    }
-    .main-content {
-        margin-left: 0;
-        padding: 70px 20px 20px 20px; /* Increased from 60px to 70px */
-    }
-    .toggle-btn {
-        display: block;
-    }
-    .theme-toggle {
-        width: 36px; /* Slightly smaller on mobile */
-        height: 36px;
-        font-size: 20px;
-    }
-    .sidebar-overlay {
-        display: none;
-    }
-    .sidebar-overlay.active {
-        display: block;
-    }
-    .card {
-        padding: 15px;
-    }
-    .chart-container {
-        height: 300px; /* Smaller fixed height for mobile */
-    }
-    .manager-header {
-        padding-top: 10px; /* Add some space above on mobile */
-    }
-}
-    </style>
-</head>
-<body>
-    <div id="loading-indicator">Loading...</div>
-    <button id="mobile-toggle" class="btn btn-primary toggle-btn" onclick="toggleSidebar()">🔍</button>
-    <div id="sidebar-overlay" class="sidebar-overlay" onclick="toggleSidebar()"></div> <!-- New overlay -->
-    <div class="sidebar">
-        <h2>SEC 13F Dashboard</h2>
-        <div class="mb-4 position-relative">
-            <input type="text" id="fund-manager-search" class="form-control" placeholder="Search fund manager...">
-            <div id="suggestions" class="dropdown-menu"></div>
-        </div>
-        <button class="btn btn-primary w-100 mb-3" onclick="toggleFilters()">Toggle Filters</button>
-        <div id="filter-section" class="filter-section card" style="display: none;">
-            <h4 class="mb-3">Filters</h4>
-            <div class="mb-3 position-relative">
-                <label for="company-filter" class="form-label">Company Name</label>
-                <input type="text" id="company-filter" class="form-control" placeholder="e.g., AMAZON">
-                <div id="company-suggestions" class="dropdown-menu"></div>
-            </div>
-            <div class="mb-3">
-                <label for="start-quarter" class="form-label">Start Quarter</label>
-                <select id="start-quarter" class="form-select">
-                    <option value="">Select Start Quarter</option>
-                </select>
-            </div>
-            <div class="mb-3">
-                <label for="end-quarter" class="form-label">End Quarter</label>
-                <select id="end-quarter" class="form-select">
-                    <option value="">Select End Quarter</option>
-                </select>
-            </div>
-            <button class="btn btn-success w-100" onclick="applyFilters()">Apply Filters</button>
-        </div>
-        <div class="sidebar-footer mt-auto">
-            <div class="theme-toggle" onclick="toggleTheme()" title="Toggle Theme">🌙</div>
-        </div>
-    </div>
-        <div class="main-content">
-            <div class="manager-header d-flex align-items-center mb-4">
-            <h2 id="manager-name" class="mb-0">Select a Fund Manager</h2>
-        </div>
-        <div class="row g-4">
-            <div class="col-md-6">
-                <div class="card">
-                    <h3 class="mb-3">Top 10 Holdings</h3>
-                    <div class="chart-container">
-                        <canvas id="top-holdings-chart"></canvas>
-                    </div>
-                </div>
-            </div>
-            <div class="col-md-6">
-                <div class="card">
-                    <h3 class="mb-3">Quarterly Changes</h3>
-                    <div class="chart-container">
-                        <canvas id="changes-chart"></canvas>
-                    </div>
-                </div>
-            </div>
-        </div>
-        <div class="row mt-4">
-            <div class="col-12">
-                <div class="card">
-                    <h3 class="mb-3">All Holdings</h3>
-                    <div class="table-responsive">
-                        <table class="table table-striped" id="holdings-table">
-                            <thead>
-                                <tr>
-                                    <th class="sortable" data-column="name_of_issuer" data-direction="asc" onclick="sortTable('name_of_issuer')">Issuer</th>
-                                    <th class="sortable" data-column="value_fixed" data-direction="asc" onclick="sortTable('value_fixed')">Value ($)</th>
-                                    <th class="sortable" data-column="sshprnamt" data-direction="asc" onclick="sortTable('sshprnamt')">Shares</th>
-                                    <th class="sortable" data-column="value_change" data-direction="asc" onclick="sortTable('value_change')">Value Change ($)</th>
-                                    <th class="sortable" data-column="sshprnamt_change" data-direction="asc" onclick="sortTable('sshprnamt_change')">Share Change</th>
-                                    <th class="sortable" data-column="quarter" data-direction="asc" onclick="sortTable('quarter')">Quarter</th>
-                                    <th class="sortable" data-column="status" data-direction="asc" onclick="sortTable('status')">Status</th>
-                                </tr>
-                            </thead>
-                            <tbody id="holdings-tbody"></tbody>
-                        </table>
-                    </div>
-                    <nav>
-                        <ul class="pagination justify-content-center mt-3" id="pagination"></ul>
-                    </nav>
-                </div>
-            </div>
-        </div>
-    </div>
-<script src="https://cdn.jsdelivr.net/npm/chart.js@3.9.1/dist/chart.min.js"></script>
-<script>
-    // Load theme from localStorage on page load
-    document.addEventListener('DOMContentLoaded', () => {
-        const savedTheme = localStorage.getItem('theme') || 'light';
-        document.documentElement.setAttribute('data-theme', savedTheme);
-        updateThemeIcon();
-        updateChartTheme(savedTheme);
-    });
-
-    function toggleTheme() {
-        const currentTheme = document.documentElement.getAttribute('data-theme') || 'light';
-        const newTheme = currentTheme === 'light' ? 'dark' : 'light';
-        document.documentElement.setAttribute('data-theme', newTheme);
-        localStorage.setItem('theme', newTheme);
-        updateThemeIcon();
-        updateChartTheme(newTheme);
-    }
-
-    function updateThemeIcon() {
-        const toggle = document.querySelector('.theme-toggle');
-        const theme = document.documentElement.getAttribute('data-theme');
-        toggle.textContent = theme === 'dark' ? '☀️' : '🌙'; // Sun for dark mode, moon for light mode
-    }
-
-    function updateChartTheme(theme) {
-        const chartOptions = {
-            light: {
-                scales: {
-                    y: { 
-                        grid: { color: 'rgba(0, 0, 0, 0.1)' },
-                        ticks: { color: '#2d3748' }
-                    },
-                    x: { 
-                        grid: { color: 'rgba(0, 0, 0, 0.1)' },
-                        ticks: { color: '#2d3748' }
-                    }
-                },
-                plugins: {
-                    legend: {
-                        labels: { color: '#2d3748' }
-                    },
-                    title: { color: '#2d3748' }
-                }
-            },
-            dark: {
-                scales: {
-                    y: { 
-                        grid: { color: 'rgba(255, 255, 255, 0.1)' },
-                        ticks: { color: '#e2e8f0' }
-                    },
-                    x: { 
-                        grid: { color: 'rgba(255, 255, 255, 0.1)' },
-                        ticks: { color: '#e2e8f0' }
-                    }
-                },
-                plugins: {
-                    legend: {
-                        labels: { color: '#e2e8f0' }
-                    },
-                    title: { color: '#e2e8f0' }
-                }
-            }
-        };
-
-        if (topHoldingsChart) {
-            topHoldingsChart.options = { ...topHoldingsChart.options, ...chartOptions[theme] };
-            topHoldingsChart.update();
-        }
-        if (changesChart) {
-            changesChart.options = { ...changesChart.options, ...chartOptions[theme] };
-            changesChart.update();
-        }
-    }
-
-    function toggleSidebar() {
-        const sidebar = document.querySelector('.sidebar');
-        const toggleBtn = document.getElementById('mobile-toggle');
-        const overlay = document.getElementById('sidebar-overlay');
-        
-        sidebar.classList.toggle('active');
-        overlay.classList.toggle('active');
-        
-        // Update button icon based on sidebar state
-        if (sidebar.classList.contains('active')) {
-            toggleBtn.textContent = '✕'; // Close icon when sidebar is open
-        } else {
-            toggleBtn.textContent = '🔍'; // Magnifying glass when sidebar is closed
-        }
-    }
-
-    let selectedCik = null;
-    const itemsPerPage = 10;
-    let currentPage = 1;
-    let allHoldings = [];
-    let filteredHoldings = [];
-    let topHoldingsChart = null;
-    let changesChart = null;
-    let availableCompanies = [];
-    let availableQuarters = [];
-
-    const issuerColorMap = {};
-
-    function getIssuerColor(issuer) {
-        if (!issuerColorMap[issuer]) {
-            let hash = 0;
-            for (let i = 0; i < issuer.length; i++) {
-                hash = issuer.charCodeAt(i) + ((hash << 5) - hash);
-            }
-            const hue = Math.abs(hash) % 360;
-            issuerColorMap[issuer] = `hsl(${hue}, 50%, 50%)`;
-        }
-        return issuerColorMap[issuer];
-    }
-
-    function showLoading() {
-        document.getElementById('loading-indicator').style.display = 'block';
-    }
-
-    function hideLoading() {
-        document.getElementById('loading-indicator').style.display = 'none';
-    }
-
-    document.getElementById('fund-manager-search').addEventListener('input', async function() {
-        const term = this.value;
-        if (term.length < 2) {
-            document.getElementById('suggestions').style.display = 'none';
-            return;
-        }
-        showLoading();
-        try {
-            const response = await fetch(`/api/suggestions?term=${term}`);
-            const data = await response.json();
-            hideLoading();
-            const suggestions = document.getElementById('suggestions');
-            suggestions.innerHTML = '';
-            data.results.forEach(fm => {
-                const item = document.createElement('div');
-                item.className = 'dropdown-item';
-                item.textContent = fm.name;
-                item.onclick = () => {
-                    this.value = fm.name;
-                    selectedCik = fm.cik;
-                    suggestions.style.display = 'none';
-                    loadData();
-                };
-                suggestions.appendChild(item);
-            });
-            suggestions.style.display = 'block';
-        } catch (error) {
-            hideLoading();
-            console.error('Error fetching suggestions:', error);
-        }
-    });
-
-    document.getElementById('company-filter').addEventListener('input', function() {
-        const term = this.value.toLowerCase();
-        if (term.length < 2) {
-            document.getElementById('company-suggestions').style.display = 'none';
-            return;
-        }
-        const suggestions = document.getElementById('company-suggestions');
-        suggestions.innerHTML = '';
-        availableCompanies
-            .filter(company => company.toLowerCase().includes(term))
-            .slice(0, 10)
-            .forEach(company => {
-                const item = document.createElement('div');
-                item.className = 'dropdown-item';
-                item.textContent = company;
-                item.onclick = () => {
-                    this.value = company;
-                    suggestions.style.display = 'none';
-                    applyFilters();
-                };
-                suggestions.appendChild(item);
-            });
-        suggestions.style.display = 'block';
-    });
-
-    async function loadData() {
-        if (!selectedCik) return;
-        showLoading();
-        try {
-            const response = await fetch(`/api/data/${selectedCik}`);
-            const data = await response.json();
-            hideLoading();
-            
-            document.getElementById('manager-name').textContent = data.manager_name;
-
-            allHoldings = data.all_holdings;
-            filteredHoldings = [...allHoldings];
-
-            availableQuarters = [...new Set(allHoldings.map(h => h.quarter))].sort();
-            const startSelect = document.getElementById('start-quarter');
-            const endSelect = document.getElementById('end-quarter');
-            startSelect.innerHTML = '<option value="">Select Start Quarter</option>';
-            endSelect.innerHTML = '<option value="">Select End Quarter</option>';
-            availableQuarters.forEach(quarter => {
-                const optionStart = document.createElement('option');
-                optionStart.value = quarter;
-                optionStart.textContent = quarter;
-                startSelect.appendChild(optionStart);
-                const optionEnd = document.createElement('option');
-                optionEnd.value = quarter;
-                optionEnd.textContent = quarter;
-                endSelect.appendChild(optionEnd);
-            });
-
-            availableCompanies = [...new Set(allHoldings.map(h => h.name_of_issuer))].sort();
-
-            renderAllVisualizations();
-            updateChartTheme(document.documentElement.getAttribute('data-theme') || 'light');
-        } catch (error) {
-            hideLoading();
-            console.error('Error loading data:', error);
-        }
-    }
-
-    function toggleFilters() {
-        const filterSection = document.getElementById('filter-section');
-        filterSection.style.display = filterSection.style.display === 'block' ? 'none' : 'block';
-    }
-
-    function applyFilters() {
-        const companyFilter = document.getElementById('company-filter').value.toLowerCase();
-        const startQuarter = document.getElementById('start-quarter').value;
-        const endQuarter = document.getElementById('end-quarter').value;
-
-        filteredHoldings = allHoldings.filter(holding => {
-            const matchesCompany = !companyFilter || holding.name_of_issuer.toLowerCase().includes(companyFilter);
-            const matchesStart = !startQuarter || holding.quarter >= startQuarter;
-            const matchesEnd = !endQuarter || holding.quarter <= endQuarter;
-            return matchesCompany && matchesStart && matchesEnd;
-        });
-
-        renderAllVisualizations();
-    }
-
-    function renderAllVisualizations() {
-        renderTopHoldingsChart();
-        renderChangesChart();
-        renderTable(1);
-    }
-
-    function renderTopHoldingsChart() {
-    if (topHoldingsChart) topHoldingsChart.destroy();
-
-    if (!filteredHoldings.length) {
-        const topCtx = document.getElementById('top-holdings-chart').getContext('2d');
-        topHoldingsChart = new Chart(topCtx, {
-            type: 'bar',
-            data: {
-                labels: ['No Data'],
-                datasets: [{
-                    label: 'Value ($)',
-                    data: [0],
-                    backgroundColor: 'rgba(54, 162, 235, 0.6)'
-                }]
-            },
-            options: {
-                scales: { y: { beginAtZero: true } },
-                responsive: true, // Ensure responsiveness
-                maintainAspectRatio: false // Allow stretching within container
-            }
-        });
-        return;
-    }
-
-    const sortedQuarters = [...new Set(filteredHoldings.map(h => h.quarter))].sort();
-    const latestQuarter = sortedQuarters[sortedQuarters.length - 1];
-
-    const topHoldingsData = filteredHoldings
-        .filter(h => h.quarter === latestQuarter)
-        .reduce((acc, curr) => {
-            const issuer = curr.name_of_issuer;
-            if (!acc[issuer]) acc[issuer] = { value_fixed: 0, sshprnamt: 0 };
-            acc[issuer].value_fixed += curr.value_fixed || 0;
-            acc[issuer].sshprnamt += curr.sshprnamt || 0;
-            return acc;
-        }, {});
-    
-    const topHoldings = Object.entries(topHoldingsData)
-        .map(([name_of_issuer, data]) => ({ name_of_issuer, ...data }))
-        .sort((a, b) => b.value_fixed - a.value_fixed)
-        .slice(0, 10);
-
-    const topCtx = document.getElementById('top-holdings-chart').getContext('2d');
-    topHoldingsChart = new Chart(topCtx, {
-        type: 'bar',
-        data: {
-            labels: topHoldings.length ? topHoldings.map(h => h.name_of_issuer) : ['No Data'],
-            datasets: [{
-                label: 'Value ($)',
-                data: topHoldings.length ? topHoldings.map(h => h.value_fixed || 0) : [0],
-                backgroundColor: 'rgba(54, 162, 235, 0.6)'
-            }]
-        },
-        options: {
-            scales: {
-                y: { beginAtZero: true, title: { display: true, text: 'Value ($)' } }
-            },
-            plugins: {
-                legend: {
-                    display: true,
-                    position: 'top', // Match Quarterly Changes
-                    labels: {
-                        font: { size: 10 },
-                        padding: 5,
-                        boxWidth: 20,
-                        usePointStyle: true
-                    },
-                    maxHeight: 50
-                },
-                title: {
-                    display: true,
-                    text: 'Top 10 Holdings',
-                    font: { size: 14 }
-                }
-            },
-            responsive: true, // Ensure chart adjusts to container
-            maintainAspectRatio: false // Allow stretching within container
-        }
-    });
-    updateChartTheme(document.documentElement.getAttribute('data-theme') || 'light');
-}
-
-    function renderChangesChart() {
-    if (changesChart) changesChart.destroy();
-
-    if (!filteredHoldings.length) {
-        const changesCtx = document.getElementById('changes-chart').getContext('2d');
-        changesChart = new Chart(changesCtx, {
-            type: 'bar',
-            data: {
-                labels: ['No Data'],
-                datasets: [{
-                    label: 'Shares',
-                    data: [0],
-                    backgroundColor: 'rgba(255, 99, 132, 0.6)'
-                }]
-            },
-            options: { scales: { y: { beginAtZero: true } } }
-        });
-        return;
-    }
-
-    const quarters = [...new Set(filteredHoldings.map(h => h.quarter))].sort();
-
-    const groupedShares = filteredHoldings.reduce((acc, curr) => {
-        const key = `${curr.name_of_issuer}-${curr.quarter}`;
-        if (!acc[key]) {
-            acc[key] = { name_of_issuer: curr.name_of_issuer, quarter: curr.quarter, sshprnamt: 0 };
-        }
-        acc[key].sshprnamt += curr.sshprnamt || 0;
-        return acc;
-    }, {});
-
-    const sharesData = Object.values(groupedShares);
-
-    const issuerTotals = filteredHoldings.reduce((acc, curr) => {
-        acc[curr.name_of_issuer] = (acc[curr.name_of_issuer] || 0) + (curr.sshprnamt || 0);
-        return acc;
-    }, {});
-    const topIssuers = Object.entries(issuerTotals)
-        .sort((a, b) => b[1] - a[1])
-        .slice(0, 5)
-        .map(entry => entry[0]);
-
-    const datasets = topIssuers.map(issuer => {
-        const data = quarters.map(quarter => {
-            const entry = sharesData.find(d => d.name_of_issuer === issuer && d.quarter === quarter);
-            return entry ? (entry.sshprnamt || 0) : 0;
-        });
-        return {
-            label: issuer,
-            data: data,
-            backgroundColor: getIssuerColor(issuer)
-        };
-    });
-
-    const changesCtx = document.getElementById('changes-chart').getContext('2d');
-    changesChart = new Chart(changesCtx, {
-        type: 'bar',
-        data: {
-            labels: quarters,
-            datasets: datasets.length ? datasets : [{ label: 'Shares', data: [0], backgroundColor: 'rgba(255, 99, 132, 0.6)' }]
-        },
-        options: {
-            scales: {
-                y: { beginAtZero: true, title: { display: true, text: 'Shares' } },
-                x: { stacked: false }
-            },
-            indexAxis: 'x',
-            plugins: {
-                legend: {
-                    display: true,
-                    position: 'top',
-                    labels: {
-                        font: { size: 10 },
-                        padding: 5,
-                        boxWidth: 20,
-                        usePointStyle: true
-                    },
-                    maxHeight: 50
-                },
-                title: {
-                    display: true,
-                    text: 'Shares Held by Top Issuers',
-                    font: { size: 14 }
-                }
-            },
-            responsive: true, // Chart adjusts to container size
-            maintainAspectRatio: false // Allow stretching within container
-        }
-    });
-    updateChartTheme(document.documentElement.getAttribute('data-theme') || 'light');
-}
-
-    function sortTable(column) {
-        const th = document.querySelector(`th[data-column="${column}"]`);
-        const currentDirection = th.getAttribute("data-direction");
-        const newDirection = currentDirection === "asc" ? "desc" : "asc";
-        th.setAttribute("data-direction", newDirection);
-
-        document.querySelectorAll(".sortable").forEach(header => {
-            if (header !== th) header.setAttribute("data-direction", "asc");
-        });
-
-        filteredHoldings.sort((a, b) => {
-            let valA = a[column];
-            let valB = b[column];
-
-            if (valA === null || valA === undefined) valA = column.includes("change") || column === "value_fixed" || column === "sshprnamt" ? -Infinity : "";
-            if (valB === null || valB === undefined) valB = column.includes("change") || column === "value_fixed" || column === "sshprnamt" ? -Infinity : "";
-
-            if (column === "value_fixed" || column === "sshprnamt" || column === "value_change" || column === "sshprnamt_change") {
-                return newDirection === "asc" ? valA - valB : valB - valA;
-            }
-
-            valA = valA.toString().toLowerCase();
-            valB = valB.toString().toLowerCase();
-            return newDirection === "asc" 
-                ? valA.localeCompare(valB) 
-                : valB.localeCompare(valA);
-        });
-
-        renderAllVisualizations();
-    }
-
-    function renderTable(page) {
-        currentPage = page;
-        const tbody = document.getElementById('holdings-tbody');
-        tbody.innerHTML = '';
-        const start = (page - 1) * itemsPerPage;
-        const end = start + itemsPerPage;
-        filteredHoldings.slice(start, end).forEach(holding => {
-            const tr = document.createElement('tr');
-            tr.className = holding.status === "New Position" ? 'new-position' : '';
-            const valueChangeStyle = holding.value_change < 0 ? 'style="color: red"' : '';
-            const shareChangeStyle = holding.sshprnamt_change < 0 ? 'style="color: red"' : '';
-            const accessionNumber = holding.accession_number; 
-            const accessionNumberNoHyphens = accessionNumber.replace(/-/g, '');
-            const filingUrl = `https://www.sec.gov/Archives/edgar/data/${selectedCik}/${accessionNumberNoHyphens}/${accessionNumber}-index.html`;
-            
-            // Style "New Position" as a pill with the link beside it
-            const statusContent = holding.status 
-                ? `<span class="status-pill">${holding.status}</span><a href="${filingUrl}" target="_blank" title="View Filing">🔗</a>`
-                : `<span style="display: block; text-align: right;"><a href="${filingUrl}" target="_blank" title="View Filing">🔗</a></span>`;
-            
-            tr.innerHTML = `
-                <td>${holding.name_of_issuer}</td>
-                <td>${holding.value_fixed === null ? 'N/A' : holding.value_fixed.toLocaleString()}</td>
-                <td>${holding.sshprnamt === null ? 'N/A' : holding.sshprnamt.toLocaleString()}</td>
-                <td ${valueChangeStyle}>${holding.value_change === null ? 'N/A' : holding.value_change.toLocaleString()}</td>
-                <td ${shareChangeStyle}>${holding.sshprnamt_change === null ? 'N/A' : holding.sshprnamt_change.toLocaleString()}</td>
-                <td>${holding.quarter}</td>
-                <td>${statusContent}</td>
-            `;
-            tbody.appendChild(tr);
-        });
-        renderPagination();
-    }
-
-    function renderPagination() {
-        const totalPages = Math.ceil(filteredHoldings.length / itemsPerPage);
-        const pagination = document.getElementById('pagination');
-        pagination.innerHTML = '';
-        
-        addPageItem(1, 1 === currentPage);
-        if (currentPage > 3) addEllipsis();
-        const startPage = Math.max(2, currentPage - 2);
-        const endPage = Math.min(totalPages - 1, currentPage + 2);
-        for (let i = startPage; i <= endPage; i++) {
-            addPageItem(i, i === currentPage);
-        }
-        if (currentPage < totalPages - 2) addEllipsis();
-        if (totalPages > 1) addPageItem(totalPages, totalPages === currentPage);
-
-        function addPageItem(page, isActive) {
-            const li = document.createElement('li');
-            li.className = `page-item ${isActive ? 'active' : ''}`;
-            li.innerHTML = `<a class="page-link" href="#" onclick="renderTable(${page}); return false;">${page}</a>`;
-            pagination.appendChild(li);
-        }
-
-        function addEllipsis() {
-            const li = document.createElement('li');
-            li.className = 'page-item disabled';
-            li.innerHTML = '<span class="page-link">...</span>';
-            pagination.appendChild(li);
-        }
-    }
-</script>
-</body>
-</html>
-"""
+    # One pooled session for the app's lifetime so SEC connections are kept alive and reused
+    app.state.http = aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=64, limit_per_host=8, keepalive_timeout=60, ttl_dns_cache=300),
+        headers={"User-Agent": USER_AGENT},
+        timeout=aiohttp.ClientTimeout(total=30),
+    )
+    build_fund_manager_index(await load_fund_manager_data(app.state.http))
+    logger.info(f"Initialized fund manager index with {len(FUND_MANAGER_NAMES)} entries")
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    await app.state.http.close()
+    if _http_cache is not None:
+        _http_cache.close()
+
+def accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows gzip, by name or via *, with a non-zero q."""
+    qualities = {}
+    for part in accept_encoding.split(","):
+        token, *params = [piece.strip() for piece in part.split(";")]
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if token:
+            qualities[token.lower()] = quality
+    return qualities.get("gzip", qualities.get("*", 0.0)) > 0
 
 @app.get("/", response_class=HTMLResponse)
-async def dashboard():
-    return INDEX_HTML
+async def dashboard(request: Request):
+    headers = {"Vary": "Accept-Encoding"}
+    if accepts_gzip(request.headers.get("accept-encoding", "")):
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=INDEX_HTML_GZ, media_type="text/html", headers=headers)
+    return Response(content=INDEX_HTML, media_type="text/html", headers=headers)
 
 @app.get("/api/suggestions")
 async def get_suggestions(term: str):
-    if not FUND_MANAGERS:
-        logger.error("FUND_MANAGERS is empty in get_suggestions")
+    if not FUND_MANAGER_NAMES:
+        logger.error("Fund manager index is empty in get_suggestions")
+        raise HTTPException(status_code=500, detail="No fund manager data available")
+    logger.info(f"Searching {len(FUND_MANAGER_NAMES)} fund managers for term: {term}")
+    term_lc = term.lower()
+    if len(term_lc) < 3:
+        candidates = range(len(FUND_MANAGER_NAMES_LC))
+    else:
+        # Every match contains all of the term's trigrams; intersect from the rarest one down
+        postings = sorted(
+            (FUND_MANAGER_TRIGRAMS.get(term_lc[j:j + 3], []) for j in range(len(term_lc) - 2)), key=len
+        )
+        common = set(postings[0])
+        for posting in postings[1:]:
+            if not common:
+                break
+            common.intersection_update(posting)
+        candidates = sorted(common)
+    results = []
+    # Trigrams don't capture order, so confirm each candidate is a real substring match
+    for i in candidates:
+        if term_lc in FUND_MANAGER_NAMES_LC[i]:
+            results.append({"cik": FUND_MANAGER_CIKS[i], "name": FUND_MANAGER_NAMES[i]})
+            if len(results) == 10:
+                break
+    return {"results": results}
+
+@app.get("/api/search")
+async def search_fund_managers(q: str, limit: int = Query(20, ge=1, le=100)):
+    if not FUND_MANAGER_NAMES:
+        logger.error("Fund manager index is empty in search_fund_managers")
         raise HTTPException(status_code=500, detail="No fund manager data available")
-    logger.info(f"Searching FUND_MANAGERS with {len(FUND_MANAGERS)} entries for term: {term}")
-    results = [fm for fm in FUND_MANAGERS if term.lower() in fm["name"].lower()]
-    return {"results": results[:10]}
+    # Prefix search over the sorted names: O(log N + matches)
+    q_lc = q.lower()
+    results = []
+    i = bisect.bisect_left(FUND_MANAGER_NAMES_LC, q_lc)
+    while i < len(FUND_MANAGER_NAMES_LC) and len(results) < limit and FUND_MANAGER_NAMES_LC[i].startswith(q_lc):
+        results.append({"cik": FUND_MANAGER_CIKS[i], "name": FUND_MANAGER_NAMES[i]})
+        i += 1
+    return {"results": results}
 
 @app.get("/api/data/{cik}")
 async def get_data(cik: str):
-    holdings = await get_holdings(cik)
-    if not holdings:
+    holdings = await get_holdings(cik, app.state.http)
+    if holdings.empty:
         raise HTTPException(status_code=404, detail="No data found for this CIK")
     analysis = analyze_holdings(holdings)
-    return analysis
+    # Filings change at most quarterly, so let the browser reuse a manager's data for a few minutes
+    return ORJSONResponse(analysis, headers={"Cache-Control": "private, max-age=300"})
 
 if __name__ == "__main__":
     import uvicorn
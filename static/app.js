@@ -0,0 +1,702 @@
+// Load theme from localStorage on page load
+document.addEventListener('DOMContentLoaded', () => {
+    const savedTheme = localStorage.getItem('theme') || 'light';
+    document.documentElement.setAttribute('data-theme', savedTheme);
+    updateThemeIcon();
+    updateChartTheme(savedTheme);
+});
+
+function toggleTheme() {
+    const newTheme = currentTheme() === 'light' ? 'dark' : 'light';
+    document.documentElement.setAttribute('data-theme', newTheme);
+    localStorage.setItem('theme', newTheme);
+    updateThemeIcon();
+    updateChartTheme(newTheme);
+}
+
+function updateThemeIcon() {
+    const toggle = document.querySelector('.theme-toggle');
+    const theme = document.documentElement.getAttribute('data-theme');
+    toggle.textContent = theme === 'dark' ? '☀️' : '🌙'; // Sun for dark mode, moon for light mode
+}
+
+const CHART_COLORS = {
+    light: { grid: 'rgba(0, 0, 0, 0.1)', text: '#2d3748' },
+    dark: { grid: 'rgba(255, 255, 255, 0.1)', text: '#e2e8f0' }
+};
+
+function currentTheme() {
+    return document.documentElement.getAttribute('data-theme') || 'light';
+}
+
+// Writes the theme colours into the options tree in place, leaving every other setting untouched
+function applyChartTheme(options, theme) {
+    const colors = CHART_COLORS[theme];
+    const scales = options.scales || (options.scales = {});
+    ['x', 'y'].forEach(axis => {
+        const scale = scales[axis] || (scales[axis] = {});
+        (scale.grid || (scale.grid = {})).color = colors.grid;
+        (scale.ticks || (scale.ticks = {})).color = colors.text;
+    });
+    const plugins = options.plugins || (options.plugins = {});
+    const legend = plugins.legend || (plugins.legend = {});
+    (legend.labels || (legend.labels = {})).color = colors.text;
+    (plugins.title || (plugins.title = {})).color = colors.text;
+    return options;
+}
+
+function updateChartTheme(theme) {
+    [topHoldingsChart, changesChart].forEach(chart => {
+        if (!chart) return;
+        applyChartTheme(chart.options, theme);
+        chart.update('none'); // Colours only, so skip animation
+    });
+}
+
+function toggleSidebar() {
+    const sidebar = document.querySelector('.sidebar');
+    const toggleBtn = document.getElementById('mobile-toggle');
+    const overlay = document.getElementById('sidebar-overlay');
+    
+    sidebar.classList.toggle('active');
+    overlay.classList.toggle('active');
+    
+    // Update button icon based on sidebar state
+    if (sidebar.classList.contains('active')) {
+        toggleBtn.textContent = '✕'; // Close icon when sidebar is open
+    } else {
+        toggleBtn.textContent = '🔍'; // Magnifying glass when sidebar is closed
+    }
+}
+
+let selectedCik = null;
+const itemsPerPage = 10;
+let currentPage = 1;
+const STATUS_LABELS = ['', 'New Position'];
+let allHoldings = toColumns([]); // Parallel columns, one entry per row (see toColumns)
+let filteredRows = new Uint32Array(0); // Indices into allHoldings that pass the filters
+let byIssuer = new Map(); // issuer -> Uint32Array of row indices
+let byQuarter = new Map(); // quarter -> Uint32Array of row indices
+let topHoldingsChart = null;
+let changesChart = null;
+let availableCompanies = [];
+let availableQuarters = [];
+
+// Virtual scrolling for large holdings tables
+const VIRTUALIZE_THRESHOLD = 200;
+const ROW_HEIGHT = 48;
+const VISIBLE_ROWS = 15;
+let virtualRows = null;
+let virtualPadTop = null;
+let virtualPadBottom = null;
+let virtualFrame = 0;
+
+const issuerColorMap = new Map();
+
+// Aggregation and sorting run in a worker; replies are matched to requests by id
+const dataWorker = new Worker(document.currentScript.dataset.worker); // Versioned URL from index.html
+const pendingJobs = new Map(); // id -> { resolve, reject }
+const latestJobs = {}; // kind -> id of the newest request, so superseded replies are dropped
+let nextJobId = 0;
+
+dataWorker.onmessage = e => {
+    const { id, result, error } = e.data;
+    const job = pendingJobs.get(id);
+    if (!job) return;
+    pendingJobs.delete(id);
+    if (error) {
+        job.reject(new Error(error));
+    } else {
+        job.resolve(result);
+    }
+};
+
+// An error the worker could not reply to (e.g. the script failed to load) fails every outstanding job
+dataWorker.onerror = e => {
+    const error = new Error(e.message || 'Worker error');
+    pendingJobs.forEach(job => job.reject(error));
+    pendingJobs.clear();
+};
+
+function runJob(kind, message, transfer = []) {
+    const id = ++nextJobId;
+    latestJobs[kind] = id;
+    dataWorker.postMessage({ ...message, id, kind }, transfer);
+    return new Promise((resolve, reject) => pendingJobs.set(id, { resolve, reject }))
+        .then(result => latestJobs[kind] === id ? result : null);
+}
+
+// Held directly because the tbody is detached from the document while it is rebuilt
+const holdingsTbody = document.getElementById('holdings-tbody');
+const rowTemplate = document.getElementById('row-tpl').content.firstElementChild;
+
+// One formatter for every cell; toLocaleString would build a new one per call
+const fmt = new Intl.NumberFormat();
+
+function formatNumber(value) {
+    return Number.isNaN(value) ? 'N/A' : fmt.format(value);
+}
+
+function getIssuerColor(issuer) {
+    let color = issuerColorMap.get(issuer);
+    if (color === undefined) {
+        // 32-bit FNV-1a; Math.imul keeps the multiply in int32 range for long names
+        let hash = 0x811c9dc5;
+        for (let i = 0; i < issuer.length; i++) {
+            hash = Math.imul(hash ^ issuer.charCodeAt(i), 0x01000193);
+        }
+        color = `hsl(${(hash >>> 0) % 360}, 50%, 50%)`;
+        issuerColorMap.set(issuer, color);
+    }
+    return color;
+}
+
+function showLoading() {
+    document.getElementById('loading-indicator').style.display = 'block';
+}
+
+function hideLoading() {
+    document.getElementById('loading-indicator').style.display = 'none';
+}
+
+function debounce(fn, ms) {
+    let timer;
+    return function(...args) {
+        clearTimeout(timer);
+        timer = setTimeout(() => fn.apply(this, args), ms);
+    };
+}
+
+// Map-backed LRU: setting a key moves it to the newest end, and the oldest entry goes past the limit
+function cacheSet(cache, key, value, limit) {
+    cache.delete(key);
+    cache.set(key, value);
+    if (cache.size > limit) cache.delete(cache.keys().next().value);
+}
+
+const DATA_CACHE_SIZE = 8;
+const SUGGESTIONS_CACHE_SIZE = 100;
+const dataCache = new Map(); // cik -> /api/data payload
+const suggestionsCache = new Map(); // term -> /api/suggestions results
+
+// Lets a newer keystroke cancel a suggestions request that is still in flight
+let suggestionsController = null;
+
+document.getElementById('fund-manager-search').addEventListener('input', debounce(async function() {
+    const term = this.value;
+    if (suggestionsController) suggestionsController.abort();
+    if (term.length < 2) {
+        hideLoading();
+        document.getElementById('suggestions').style.display = 'none';
+        return;
+    }
+    try {
+        let results = suggestionsCache.get(term);
+        if (!results) {
+            const controller = suggestionsController = new AbortController();
+            showLoading();
+            const response = await fetch(`/api/suggestions?term=${encodeURIComponent(term)}`, { signal: controller.signal });
+            results = (await response.json()).results;
+        }
+        hideLoading(); // Also clears the indicator left by an aborted request
+        cacheSet(suggestionsCache, term, results, SUGGESTIONS_CACHE_SIZE);
+        const suggestions = document.getElementById('suggestions');
+        suggestions.innerHTML = '';
+        results.forEach(fm => {
+            const item = document.createElement('div');
+            item.className = 'dropdown-item';
+            item.textContent = fm.name;
+            item.dataset.cik = fm.cik;
+            suggestions.appendChild(item);
+        });
+        suggestions.style.display = 'block';
+    } catch (error) {
+        if (error.name === 'AbortError') return; // Superseded by a newer request
+        hideLoading();
+        console.error('Error fetching suggestions:', error);
+    }
+}, 200));
+
+document.getElementById('company-filter').addEventListener('input', debounce(function() {
+    const term = this.value.toLowerCase();
+    if (term.length < 2) {
+        document.getElementById('company-suggestions').style.display = 'none';
+        return;
+    }
+    const suggestions = document.getElementById('company-suggestions');
+    suggestions.innerHTML = '';
+    availableCompanies
+        .filter(company => company.toLowerCase().includes(term))
+        .slice(0, 10)
+        .forEach(company => {
+            const item = document.createElement('div');
+            item.className = 'dropdown-item';
+            item.textContent = company;
+            suggestions.appendChild(item);
+        });
+    suggestions.style.display = 'block';
+}, 200));
+
+// One click listener per dropdown reads the chosen item, so rebuilding the lists installs no handlers
+document.getElementById('suggestions').addEventListener('click', function(e) {
+    const item = e.target.closest('.dropdown-item');
+    if (!item) return;
+    document.getElementById('fund-manager-search').value = item.textContent;
+    selectedCik = item.dataset.cik;
+    this.style.display = 'none';
+    loadData();
+});
+
+document.getElementById('company-suggestions').addEventListener('click', function(e) {
+    const item = e.target.closest('.dropdown-item');
+    if (!item) return;
+    document.getElementById('company-filter').value = item.textContent;
+    this.style.display = 'none';
+    applyFilters();
+});
+
+document.getElementById('pagination').addEventListener('click', e => {
+    const link = e.target.closest('a[data-page]');
+    if (!link) return;
+    e.preventDefault();
+    renderTable(Number(link.dataset.page));
+});
+
+async function loadData() {
+    if (!selectedCik) return;
+    const cik = selectedCik;
+    try {
+        let data = dataCache.get(cik);
+        if (!data) {
+            showLoading();
+            const response = await fetch(`/api/data/${cik}`);
+            if (!response.ok) throw new Error(`Request failed with status ${response.status}`);
+            data = await response.json();
+            hideLoading();
+        }
+        cacheSet(dataCache, cik, data, DATA_CACHE_SIZE);
+
+        document.getElementById('manager-name').textContent = data.manager_name;
+
+        allHoldings = toColumns(data.all_holdings);
+        filteredRows = Uint32Array.from(allHoldings.names.keys());
+        byIssuer = indexRowsBy(allHoldings.names);
+        byQuarter = indexRowsBy(allHoldings.quarters);
+        dataWorker.postMessage({ kind: 'load', holdings: allHoldings });
+
+        availableQuarters = [...byQuarter.keys()].sort();
+        const startSelect = document.getElementById('start-quarter');
+        const endSelect = document.getElementById('end-quarter');
+        startSelect.innerHTML = '<option value="">Select Start Quarter</option>';
+        endSelect.innerHTML = '<option value="">Select End Quarter</option>';
+        availableQuarters.forEach(quarter => {
+            const optionStart = document.createElement('option');
+            optionStart.value = quarter;
+            optionStart.textContent = quarter;
+            startSelect.appendChild(optionStart);
+            const optionEnd = document.createElement('option');
+            optionEnd.value = quarter;
+            optionEnd.textContent = quarter;
+            endSelect.appendChild(optionEnd);
+        });
+
+        availableCompanies = [...byIssuer.keys()].sort();
+        availableCompanies.forEach(getIssuerColor); // Warm the colour cache so chart renders only do lookups
+
+        renderAllVisualizations();
+    } catch (error) {
+        hideLoading();
+        console.error('Error loading data:', error);
+    }
+}
+
+function toggleFilters() {
+    const filterSection = document.getElementById('filter-section');
+    filterSection.style.display = filterSection.style.display === 'block' ? 'none' : 'block';
+}
+
+function applyFilters() {
+    const companyFilter = document.getElementById('company-filter').value.toLowerCase();
+    const startQuarter = document.getElementById('start-quarter').value;
+    const endQuarter = document.getElementById('end-quarter').value;
+
+    const inRange = quarter => (!startQuarter || quarter >= startQuarter) && (!endQuarter || quarter <= endQuarter);
+
+    // Union the inverted-index lists of matching issuers (or quarters) instead of scanning every row
+    const lists = companyFilter
+        ? availableCompanies.filter(company => company.toLowerCase().includes(companyFilter)).map(company => byIssuer.get(company))
+        : availableQuarters.filter(inRange).map(quarter => byQuarter.get(quarter));
+    let rows = new Uint32Array(lists.reduce((total, list) => total + list.length, 0));
+    let offset = 0;
+    lists.forEach(list => {
+        rows.set(list, offset);
+        offset += list.length;
+    });
+    if (companyFilter && (startQuarter || endQuarter)) {
+        rows = rows.filter(r => inRange(allHoldings.quarters[r]));
+    }
+    filteredRows = rows.sort(); // Restore allHoldings order
+
+    renderAllVisualizations();
+}
+
+// Transposes the API's row objects into parallel columns; missing numbers become NaN
+function toColumns(records) {
+    const n = records.length;
+    const columns = {
+        n,
+        names: new Array(n),
+        quarters: new Array(n),
+        accessions: new Array(n),
+        valueFixed: new Float64Array(n),
+        sshprnamt: new Float64Array(n),
+        valueChange: new Float64Array(n),
+        sshprnamtChange: new Float64Array(n),
+        status: new Uint8Array(n) // Index into STATUS_LABELS
+    };
+    for (let i = 0; i < n; i++) {
+        const h = records[i];
+        columns.names[i] = h.name_of_issuer ?? '';
+        columns.quarters[i] = h.quarter;
+        columns.accessions[i] = h.accession_number;
+        columns.valueFixed[i] = h.value_fixed ?? NaN;
+        columns.sshprnamt[i] = h.sshprnamt ?? NaN;
+        columns.valueChange[i] = h.value_change ?? NaN;
+        columns.sshprnamtChange[i] = h.sshprnamt_change ?? NaN;
+        columns.status[i] = h.status === STATUS_LABELS[1] ? 1 : 0;
+    }
+    return columns;
+}
+
+function indexRowsBy(values) {
+    const lists = new Map();
+    values.forEach((key, i) => {
+        if (!lists.has(key)) lists.set(key, []);
+        lists.get(key).push(i);
+    });
+    return new Map([...lists].map(([key, list]) => [key, Uint32Array.from(list)]));
+}
+
+const requestIdle = window.requestIdleCallback || (callback => setTimeout(callback, 0));
+let renderFrame = 0;
+
+// Chart updates wait here, keyed by canvas id, until that canvas scrolls into view
+const deferredCharts = new Map();
+const visibleCharts = new Set();
+const chartObserver = new IntersectionObserver(entries => {
+    entries.forEach(entry => {
+        const id = entry.target.id;
+        if (!entry.isIntersecting) {
+            visibleCharts.delete(id);
+            return;
+        }
+        visibleCharts.add(id);
+        const render = deferredCharts.get(id);
+        deferredCharts.delete(id);
+        if (render) render();
+    });
+});
+['top-holdings-chart', 'changes-chart'].forEach(id => chartObserver.observe(document.getElementById(id)));
+
+function whenChartVisible(id, render) {
+    if (visibleCharts.has(id)) {
+        render();
+    } else {
+        deferredCharts.set(id, render); // Only the newest update matters
+    }
+}
+
+function renderAllVisualizations() {
+    // The table paints in the next frame; chart work follows once the browser is idle
+    cancelAnimationFrame(renderFrame);
+    renderFrame = requestAnimationFrame(() => {
+        renderFrame = 0;
+        // Rebuild the rows while the tbody is out of the layout tree, then reattach once
+        const parent = holdingsTbody.parentNode;
+        const next = holdingsTbody.nextSibling;
+        holdingsTbody.remove();
+        try {
+            renderTable(1);
+        } finally {
+            parent.insertBefore(holdingsTbody, next);
+        }
+        const rows = filteredRows;
+        requestIdle(() => renderCharts(rows), { timeout: 200 });
+    });
+}
+
+// Chart data is aggregated in the worker; only the canvas work stays on the main thread
+async function renderCharts(rows) {
+    let charts;
+    try {
+        charts = await runJob('charts', { rows });
+    } catch (error) {
+        console.error('Error aggregating chart data:', error);
+        return;
+    }
+    if (!charts) return; // A newer render has been requested
+    whenChartVisible('top-holdings-chart', () => renderTopHoldingsChart(charts.top));
+    whenChartVisible('changes-chart', () => renderChangesChart(charts.changes));
+}
+
+// Charts are created once and then fed new data, so re-renders skip canvas and scale setup
+function renderTopHoldingsChart({ labels, values }) {
+if (topHoldingsChart) {
+    topHoldingsChart.data.labels = labels;
+    topHoldingsChart.data.datasets[0].data = values;
+    topHoldingsChart.update('none');
+    return;
+}
+
+const topCtx = document.getElementById('top-holdings-chart').getContext('2d');
+topHoldingsChart = new Chart(topCtx, {
+    type: 'bar',
+    data: {
+        labels: labels,
+        datasets: [{
+            label: 'Value ($)',
+            data: values,
+            backgroundColor: 'rgba(54, 162, 235, 0.6)'
+        }]
+    },
+    options: applyChartTheme({
+        scales: {
+            y: { beginAtZero: true, title: { display: true, text: 'Value ($)' } }
+        },
+        plugins: {
+            legend: {
+                display: true,
+                position: 'top', // Match Quarterly Changes
+                labels: {
+                    font: { size: 10 },
+                    padding: 5,
+                    boxWidth: 20,
+                    usePointStyle: true
+                },
+                maxHeight: 50
+            },
+            title: {
+                display: true,
+                text: 'Top 10 Holdings',
+                font: { size: 14 }
+            }
+        },
+        responsive: true, // Ensure chart adjusts to container
+        maintainAspectRatio: false // Allow stretching within container
+    }, currentTheme())
+});
+}
+
+function renderChangesChart({ labels: quarters, datasets }) {
+datasets.forEach(dataset => {
+    dataset.backgroundColor = getIssuerColor(dataset.label);
+});
+if (!datasets.length) {
+    datasets.push({ label: 'Shares', data: [0], backgroundColor: 'rgba(255, 99, 132, 0.6)' });
+}
+
+if (changesChart) {
+    changesChart.data.labels = quarters;
+    changesChart.data.datasets = datasets;
+    changesChart.update('none');
+    return;
+}
+
+const changesCtx = document.getElementById('changes-chart').getContext('2d');
+changesChart = new Chart(changesCtx, {
+    type: 'bar',
+    data: {
+        labels: quarters,
+        datasets: datasets
+    },
+    options: applyChartTheme({
+        scales: {
+            y: { beginAtZero: true, title: { display: true, text: 'Shares' } },
+            x: { stacked: false }
+        },
+        indexAxis: 'x',
+        plugins: {
+            legend: {
+                display: true,
+                position: 'top',
+                labels: {
+                    font: { size: 10 },
+                    padding: 5,
+                    boxWidth: 20,
+                    usePointStyle: true
+                },
+                maxHeight: 50
+            },
+            title: {
+                display: true,
+                text: 'Shares Held by Top Issuers',
+                font: { size: 14 }
+            }
+        },
+        responsive: true, // Chart adjusts to container size
+        maintainAspectRatio: false // Allow stretching within container
+    }, currentTheme())
+});
+}
+
+async function sortTable(column) {
+    const th = document.querySelector(`th[data-column="${column}"]`);
+    const currentDirection = th.getAttribute("data-direction");
+    const newDirection = currentDirection === "asc" ? "desc" : "asc";
+    th.setAttribute("data-direction", newDirection);
+
+    document.querySelectorAll(".sortable").forEach(header => {
+        if (header !== th) header.setAttribute("data-direction", "asc");
+    });
+
+    const rows = filteredRows;
+    const copy = rows.slice();
+    let sorted;
+    try {
+        sorted = await runJob('sort', { rows: copy, column, direction: newDirection }, [copy.buffer]);
+    } catch (error) {
+        console.error('Error sorting holdings:', error);
+        return;
+    }
+    // Drop the result if a newer sort or a filter change replaced the rows meanwhile
+    if (!sorted || filteredRows !== rows) return;
+    filteredRows = sorted;
+
+    renderAllVisualizations();
+}
+
+function renderTable(page) {
+    // Large result sets scroll through a fixed pool of rows instead of paginating
+    if (filteredRows.length > VIRTUALIZE_THRESHOLD) {
+        renderVirtualTable();
+        return;
+    }
+    disableVirtualTable();
+
+    currentPage = page;
+    const start = (page - 1) * itemsPerPage;
+    const end = start + itemsPerPage;
+    // Build rows off-document so the tbody is invalidated once, not once per row
+    const frag = document.createDocumentFragment();
+    filteredRows.subarray(start, end).forEach(r => {
+        const tr = rowTemplate.cloneNode(true);
+        fillRow(tr, r);
+        frag.appendChild(tr);
+    });
+    holdingsTbody.replaceChildren(frag);
+    renderPagination();
+}
+
+// Fills a row cloned from #row-tpl; text goes through textContent so nothing is parsed as HTML
+function fillRow(tr, r) {
+    const cells = tr.cells;
+    const status = allHoldings.status[r];
+    tr.className = status ? 'new-position' : '';
+    const accessionNumber = allHoldings.accessions[r];
+    const accessionNumberNoHyphens = accessionNumber.replace(/-/g, '');
+    const filingUrl = `https://www.sec.gov/Archives/edgar/data/${selectedCik}/${accessionNumberNoHyphens}/${accessionNumber}-index.html`;
+
+    cells[0].textContent = allHoldings.names[r];
+    cells[1].textContent = formatNumber(allHoldings.valueFixed[r]);
+    cells[2].textContent = formatNumber(allHoldings.sshprnamt[r]);
+    cells[3].textContent = formatNumber(allHoldings.valueChange[r]);
+    cells[3].classList.toggle('neg', allHoldings.valueChange[r] < 0);
+    cells[4].textContent = formatNumber(allHoldings.sshprnamtChange[r]);
+    cells[4].classList.toggle('neg', allHoldings.sshprnamtChange[r] < 0);
+    cells[5].textContent = allHoldings.quarters[r];
+
+    // Style "New Position" as a pill with the link beside it; an empty pill is hidden by CSS
+    const statusCell = cells[6];
+    statusCell.classList.toggle('link-only', !status);
+    statusCell.firstElementChild.textContent = STATUS_LABELS[status];
+    statusCell.lastElementChild.href = filingUrl;
+}
+
+function renderVirtualTable() {
+    const viewport = document.getElementById('holdings-viewport');
+    if (!virtualRows) {
+        viewport.classList.add('virtualized');
+        // Pad rows stand in for everything above and below the pool, so the scroll height is exactly n rows
+        const frag = document.createDocumentFragment();
+        virtualPadTop = frag.appendChild(createPadRow());
+        // One spare row covers the partially visible row while scrolling
+        virtualRows = [];
+        for (let i = 0; i <= VISIBLE_ROWS; i++) {
+            virtualRows.push(frag.appendChild(rowTemplate.cloneNode(true)));
+        }
+        virtualPadBottom = frag.appendChild(createPadRow());
+        holdingsTbody.replaceChildren(frag);
+        viewport.addEventListener('scroll', scheduleVirtualUpdate);
+        document.getElementById('pagination').innerHTML = '';
+    }
+    const headerHeight = document.querySelector('#holdings-table thead').offsetHeight;
+    viewport.style.height = `${headerHeight + VISIBLE_ROWS * ROW_HEIGHT}px`;
+    viewport.scrollTop = 0;
+    updateVirtualRows();
+}
+
+function createPadRow() {
+    const tr = document.createElement('tr');
+    tr.className = 'virtual-pad';
+    tr.insertCell().colSpan = rowTemplate.cells.length;
+    return tr;
+}
+
+function scheduleVirtualUpdate() {
+    if (virtualFrame) return;
+    virtualFrame = requestAnimationFrame(() => {
+        virtualFrame = 0;
+        updateVirtualRows();
+    });
+}
+
+function updateVirtualRows() {
+    if (!virtualRows) return;
+    const scrollTop = document.getElementById('holdings-viewport').scrollTop;
+    // Only tables above VIRTUALIZE_THRESHOLD get here, so the pool is always full
+    const maxStart = filteredRows.length - virtualRows.length;
+    const startIndex = Math.min(Math.floor(scrollTop / ROW_HEIGHT), maxStart);
+    virtualRows.forEach((tr, i) => fillRow(tr, filteredRows[startIndex + i]));
+    // The rows scroll natively; the pads keep the pool sitting under the visible window
+    virtualPadTop.firstChild.style.height = `${startIndex * ROW_HEIGHT}px`;
+    virtualPadBottom.firstChild.style.height = `${(maxStart - startIndex) * ROW_HEIGHT}px`;
+}
+
+function disableVirtualTable() {
+    if (!virtualRows) return;
+    const viewport = document.getElementById('holdings-viewport');
+    viewport.classList.remove('virtualized');
+    viewport.style.height = '';
+    viewport.removeEventListener('scroll', scheduleVirtualUpdate);
+    virtualRows = virtualPadTop = virtualPadBottom = null;
+}
+
+function renderPagination() {
+    const totalPages = Math.ceil(filteredRows.length / itemsPerPage);
+    const frag = document.createDocumentFragment();
+    
+    addPageItem(1, 1 === currentPage);
+    if (currentPage > 3) addEllipsis();
+    const startPage = Math.max(2, currentPage - 2);
+    const endPage = Math.min(totalPages - 1, currentPage + 2);
+    for (let i = startPage; i <= endPage; i++) {
+        addPageItem(i, i === currentPage);
+    }
+    if (currentPage < totalPages - 2) addEllipsis();
+    if (totalPages > 1) addPageItem(totalPages, totalPages === currentPage);
+    document.getElementById('pagination').replaceChildren(frag);
+
+    function addPageItem(page, isActive) {
+        const li = document.createElement('li');
+        li.className = `page-item ${isActive ? 'active' : ''}`;
+        li.innerHTML = `<a class="page-link" href="#" data-page="${page}">${page}</a>`;
+        frag.appendChild(li);
+    }
+
+    function addEllipsis() {
+        const li = document.createElement('li');
+        li.className = 'page-item disabled';
+        li.innerHTML = '<span class="page-link">...</span>';
+        frag.appendChild(li);
+    }
+}
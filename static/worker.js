@@ -0,0 +1,133 @@
+// Chart aggregation and table sorting for the dashboard, kept off the main thread.
+// Requests arrive as { id, kind, ... } and are answered with { id, result } or { id, error }.
+
+// Table column -> holdings column (see toColumns in app.js)
+const COLUMNS = {
+    name_of_issuer: 'names',
+    quarter: 'quarters',
+    value_fixed: 'valueFixed',
+    sshprnamt: 'sshprnamt',
+    value_change: 'valueChange',
+    sshprnamt_change: 'sshprnamtChange',
+    status: 'status'
+};
+
+const collator = new Intl.Collator(undefined, { sensitivity: 'base' });
+
+let allHoldings = { n: 0 };
+// Numeric sort keys per column, indexed by position in allHoldings
+let sortCache = {};
+
+// Ranks each row's text in locale order, so sorting compares numbers but keeps localeCompare's order
+function rankStrings(values) {
+    const distinct = [...new Set(values)].sort(collator.compare);
+    const rankOf = new Map();
+    let rank = 0;
+    distinct.forEach((value, i) => {
+        if (i > 0 && collator.compare(distinct[i - 1], value) !== 0) rank++;
+        rankOf.set(value, rank);
+    });
+    return Uint32Array.from(values, value => rankOf.get(value));
+}
+
+function getSortKeys(column) {
+    if (!sortCache[column]) {
+        const values = allHoldings[COLUMNS[column]];
+        // Missing numbers (NaN) sort first; status indices already order '' before 'New Position'
+        sortCache[column] = ArrayBuffer.isView(values)
+            ? Float64Array.from(values, v => Number.isNaN(v) ? -Infinity : v)
+            : rankStrings(values);
+    }
+    return sortCache[column];
+}
+
+// Sort row indices against precomputed keys so the comparator does no lookups or allocation
+function sortRows(rows, column, direction) {
+    const keys = getSortKeys(column);
+    const dir = direction === 'asc' ? 1 : -1;
+    return rows.sort((i, j) => dir * (keys[i] - keys[j] || 0));
+}
+
+// One pass over the filtered rows feeds both charts
+function aggregateHoldings(rows) {
+    const quarterSet = new Set();
+    const issuers = new Map(); // issuer -> { totalShares, byQuarter: Map(quarter -> { value, shares }) }
+    let latestQuarter = null;
+    const { names, quarters, valueFixed, sshprnamt } = allHoldings;
+    for (let i = 0; i < rows.length; i++) {
+        const r = rows[i];
+        const quarter = quarters[r];
+        quarterSet.add(quarter);
+        if (latestQuarter === null || quarter > latestQuarter) latestQuarter = quarter;
+        let issuerAgg = issuers.get(names[r]);
+        if (!issuerAgg) {
+            issuerAgg = { totalShares: 0, byQuarter: new Map() };
+            issuers.set(names[r], issuerAgg);
+        }
+        let cell = issuerAgg.byQuarter.get(quarter);
+        if (!cell) {
+            cell = { value: 0, shares: 0 };
+            issuerAgg.byQuarter.set(quarter, cell);
+        }
+        // NaN marks a missing value and counts as zero
+        const shares = sshprnamt[r] || 0;
+        cell.value += valueFixed[r] || 0;
+        cell.shares += shares;
+        issuerAgg.totalShares += shares;
+    }
+    return { quarters: [...quarterSet].sort(), latestQuarter, issuers };
+}
+
+// Labels and series for both charts; colours are left to the main thread
+function chartData(rows) {
+    const agg = aggregateHoldings(rows);
+
+    const topHoldings = [];
+    agg.issuers.forEach((issuerAgg, name_of_issuer) => {
+        const cell = issuerAgg.byQuarter.get(agg.latestQuarter);
+        if (cell) topHoldings.push({ name_of_issuer, value_fixed: cell.value });
+    });
+    topHoldings.sort((a, b) => b.value_fixed - a.value_fixed);
+    topHoldings.length = Math.min(topHoldings.length, 10);
+
+    const quarters = agg.issuers.size ? agg.quarters : ['No Data'];
+    const datasets = [...agg.issuers]
+        .sort((a, b) => b[1].totalShares - a[1].totalShares)
+        .slice(0, 5)
+        .map(([issuer, issuerAgg]) => ({
+            label: issuer,
+            data: quarters.map(quarter => issuerAgg.byQuarter.has(quarter) ? issuerAgg.byQuarter.get(quarter).shares : 0)
+        }));
+
+    return {
+        top: {
+            labels: topHoldings.length ? topHoldings.map(h => h.name_of_issuer) : ['No Data'],
+            values: topHoldings.length ? topHoldings.map(h => h.value_fixed || 0) : [0]
+        },
+        changes: { labels: quarters, datasets }
+    };
+}
+
+self.onmessage = e => {
+    const message = e.data;
+    try {
+        switch (message.kind) {
+            case 'load':
+                allHoldings = message.holdings;
+                sortCache = {};
+                break;
+            case 'charts':
+                self.postMessage({ id: message.id, result: chartData(message.rows) });
+                break;
+            case 'sort': {
+                const rows = sortRows(message.rows, message.column, message.direction);
+                self.postMessage({ id: message.id, result: rows }, [rows.buffer]);
+                break;
+            }
+        }
+    } catch (error) {
+        // Answer anyway so the caller's promise settles instead of waiting forever
+        if (message.id !== undefined) self.postMessage({ id: message.id, error: error instanceof Error ? error.message : String(error) });
+        else console.error('Worker failed to handle', message.kind, error);
+    }
+};